@@ -17,6 +17,11 @@ In this example, the calibration values of these four lines are 12, 38, 15, and
 Consider your entire calibration document. What is the sum of all of the calibration values?
 """
 
+from pathlib import Path
+
+# Next to this file, so it runs from any directory
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
 
 def find_first_digit(line: str) -> int:
     """Finds the first digit in a line of text.
@@ -51,11 +56,10 @@ def part_1() -> None:
 
     """
     total = 0
-    with open("input.txt", "r") as f:
-        for line in f:
-            first_digit = find_first_digit(line)
-            last_digit = find_last_digit(line)
-            total += first_digit * 10 + last_digit
+    for line in INPUT_PATH.read_text().splitlines(keepends=True):
+        first_digit = find_first_digit(line)
+        last_digit = find_last_digit(line)
+        total += first_digit * 10 + last_digit
     print(total)
 
 
@@ -136,9 +140,8 @@ def part_2() -> None:
     one, two, three, four, five, six, seven, eight, and nine also count as valid "digits".
     """
     total = 0
-    with open("input.txt", "r") as f:
-        for line in f:
-            total += find_first_digit_with_words(line) * 10 + find_last_digit_with_words(line)
+    for line in INPUT_PATH.read_text().splitlines(keepends=True):
+        total += find_first_digit_with_words(line) * 10 + find_last_digit_with_words(line)
 
     print(total)
 
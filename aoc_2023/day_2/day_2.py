@@ -1,4 +1,8 @@
 import re
+from pathlib import Path
+
+# Next to this file, so it runs from any directory
+INPUT_PATH = Path(__file__).parent / "input.txt"
 
 
 GAME_HAD = {
@@ -61,8 +65,7 @@ def part_2(_input) -> None:
 
 
 def main() -> None:
-    with open("input.txt", "r") as file:
-        _input = file.read()
+    _input = INPUT_PATH.read_text()
     part_1(_input)
     part_2(_input)
 
@@ -1,4 +1,8 @@
 import re
+from pathlib import Path
+
+# Next to this file, so it runs from any directory
+INPUT_PATH = Path(__file__).parent / "input.txt"
 
 
 sample_input = """467..114..
@@ -94,8 +98,7 @@ def part_1(_input) -> None:
 
 
 def main():
-    with open("input.txt", "r") as file:
-        _input = file.read()
+    _input = INPUT_PATH.read_text()
     # print(set(_input) - set(string.digits))
 
     part_1(_input)
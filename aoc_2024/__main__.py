@@ -0,0 +1,140 @@
+"""Command line entry point: ``python -m aoc_2024 run --day 6 --part 2``"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+from aoc_2024 import result_cache, runner
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc_2024")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run one or more days")
+    which_days = run_parser.add_mutually_exclusive_group(required=True)
+    which_days.add_argument(
+        "--day", type=int, action="append", help="Day to run, can be repeated"
+    )
+    which_days.add_argument(
+        "--all", action="store_true", help="Run every day that has an input"
+    )
+    run_parser.add_argument(
+        "--part", type=int, choices=runner.PARTS, help="Only run this part"
+    )
+    # Tracing memory under cProfile would measure cProfile too
+    profilers = run_parser.add_mutually_exclusive_group()
+    profilers.add_argument(
+        "--profile",
+        type=int,
+        nargs="?",
+        const=20,
+        metavar="TOP",
+        help="Profile with cProfile and print the TOP cumulative hotspots",
+    )
+    run_parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        help="With --profile, also write day_N_part_M.prof files here",
+    )
+    profilers.add_argument(
+        "--memory",
+        type=int,
+        nargs="?",
+        const=10,
+        metavar="TOP",
+        help="Trace with tracemalloc, print the peak and TOP allocating lines",
+    )
+    run_parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        metavar="N",
+        help="Run the day/part jobs across N processes and print a summary table",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve, ignoring and not updating the result cache",
+    )
+
+    cache_parser = subparsers.add_parser("cache", help="Manage the result cache")
+    cache_parser.add_argument(
+        "--clear", action="store_true", help="Delete every cached answer"
+    )
+    cache_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        help="Delete answers that haven't been used for this many days",
+    )
+    cache_parser.add_argument(
+        "--max-size-mb",
+        type=float,
+        help="Delete least recently used answers until the cache is this small",
+    )
+    return parser
+
+
+def manage_cache(args: argparse.Namespace) -> None:
+    if args.clear:
+        removed = result_cache.clear()
+    else:
+        removed = result_cache.evict(
+            max_age_seconds=args.max_age_days * 24 * 60 * 60
+            if args.max_age_days is not None
+            else None,
+            max_bytes=int(args.max_size_mb * 2**20)
+            if args.max_size_mb is not None
+            else None,
+        )
+    print(f"Removed {removed} cached answers from {result_cache.CACHE_DIR}")
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "cache":
+        manage_cache(args)
+        return
+
+    if args.all:
+        days = [
+            day for day in runner.discover_days() if runner.input_path(day).is_file()
+        ]
+    else:
+        days = args.day
+    parts = [args.part] if args.part else runner.PARTS
+
+    if args.profile_dir is not None and args.profile is None:
+        parser.error("--profile-dir needs --profile")
+
+    options = runner.RunOptions(
+        profile_top=args.profile,
+        profile_dir=args.profile_dir,
+        memory_top=args.memory,
+        use_cache=not args.no_cache,
+    )
+    if args.jobs is not None:
+        if options.profiling:
+            parser.error("--jobs can't be combined with --profile or --memory")
+        # Pulls in multiprocessing, which a plain run never needs
+        from aoc_2024 import scheduler
+
+        start_time = time.perf_counter_ns()
+        results = scheduler.run_all(days, parts, args.jobs, options)
+        scheduler.print_report(results, time.perf_counter_ns() - start_time)
+        return
+
+    for day in days:
+        runner.run_day(day, parts, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -64,25 +64,36 @@ In the example above, this is 2 + 1 + 0 + 1 + 2 + 5, a total distance of 11!
 Your actual left and right lists contain many location IDs. What is the total distance between your lists?
 """
 
+import dataclasses
 from collections import defaultdict
 from typing import List
 
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
 
 
-def part_1_naive(input_list: List[str]) -> int:
+@dataclasses.dataclass
+class LocationLists:
+    left: List[int]
+    right: List[int]
+
+
+def parse(raw_input: str) -> LocationLists:
     left_list = []
     right_list = []
 
     # Create the two lists
-    for list_entry in input_list:
+    for list_entry in raw_input.split("\n"):
         entry = list_entry.split("   ")
         left_list.append(int(entry[0]))
         right_list.append(int(entry[1]))
 
-    # Sort
-    left_list.sort()
-    right_list.sort()
+    return LocationLists(left_list, right_list)
+
+
+def part_1_naive(location_lists: LocationLists) -> int:
+    # Sort copies, part 2 gets the same lists
+    left_list = sorted(location_lists.left)
+    right_list = sorted(location_lists.right)
 
     sum_of_diffs = 0
     for left, right in zip(left_list, right_list):
@@ -91,6 +102,9 @@ def part_1_naive(input_list: List[str]) -> int:
     return sum_of_diffs
 
 
+part_1 = part_1_naive
+
+
 """
 --- Part Two ---
 Your analysis only confirmed what everyone feared: the two lists of location IDs are indeed very different.
@@ -129,31 +143,21 @@ So, for these example lists, the similarity score at the end of this process is
 Once again consider your left and right lists. What is their similarity score?"""
 
 
-def part_2(input_list: List[str]) -> int:
-    left_list: List[int] = []
+def part_2(location_lists: LocationLists) -> int:
     right_dict: defaultdict[int, int] = defaultdict(int)
 
-    for line in input_list:
-        entry = line.split("  ")
-        left_entry = int(entry[0])
-        right_entry = int(entry[1])
-
-        left_list.append(left_entry)
+    for right_entry in location_lists.right:
         right_dict[right_entry] += 1
 
     total = 0
-    for entry in left_list:
+    for entry in location_lists.left:
         total += entry * right_dict[entry]
 
     return total
 
 
 def main() -> None:
-    raw_input = load_input()
-    input_list = raw_input.split("\n")
-
-    print(f"Part 1 Result: {part_1_naive(input_list)}")
-    print(f"Part 2 Result: {part_2(input_list)}")
+    run_day(1)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,4 @@
-import time
-
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
 
 
 def part_1(raw_input: str) -> int:
@@ -12,21 +10,7 @@ def part_2(raw_input: str) -> int:
 
 
 def main():
-    def main():
-        raw_input = load_input()
-        # raw_input = example_input
-
-        start_time = time.time()
-        part_1_answer = part_1(raw_input)
-        print(f"Part 1 result: {part_1_answer}")
-        end_time = time.time()
-        print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-        start_time = time.time()
-        part_2_answer = part_2(raw_input)
-        print(f"Part 2 result: {part_2_answer}")
-        end_time = time.time()
-        print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(10)
 
 
 if __name__ == "__main__":
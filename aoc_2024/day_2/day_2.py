@@ -56,7 +56,13 @@ import dataclasses
 from enum import StrEnum
 from typing import List
 
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
+
+
+def parse(raw_input: str) -> List[List[int]]:
+    return [
+        [int(level) for level in report.split(" ")] for report in raw_input.split("\n")
+    ]
 
 
 class SafetyReason(StrEnum):
@@ -92,11 +98,9 @@ def _is_safe(level_list: List[int]) -> SafetyResult:
     return SafetyResult(True)
 
 
-def part_1(input_list: List[str]) -> int:
+def part_1(reports: List[List[int]]) -> int:
     num_safe_reports = 0
-    for report in input_list:
-        report_list = [int(level) for level in report.split(" ")]
-
+    for report_list in reports:
         ascending = True if report_list[0] < report_list[1] else False
 
         safe = True
@@ -117,11 +121,9 @@ def part_1(input_list: List[str]) -> int:
     return num_safe_reports
 
 
-def part_1_updated(input_list: List[str]) -> int:
+def part_1_updated(reports: List[List[int]]) -> int:
     num_safe_reports = 0
-    for report in input_list:
-        report_list = [int(level) for level in report.split(" ")]
-
+    for report_list in reports:
         report_is_safe = _is_safe(report_list)
         if report_is_safe:
             num_safe_reports += 1
@@ -150,10 +152,9 @@ def _is_safe_pt_2(level_list: List[int]) -> bool:
     return False
 
 
-def part_2(input_list: List[str]) -> int:
+def part_2(reports: List[List[int]]) -> int:
     num_safe_reports = 0
-    for report in input_list:
-        report_list = [int(level) for level in report.split(" ")]
+    for report_list in reports:
         if _is_safe_pt_2(report_list):
             num_safe_reports += 1
 
@@ -161,15 +162,7 @@ def part_2(input_list: List[str]) -> int:
 
 
 def main():
-    raw_input = load_input()
-    input_list = raw_input.split("\n")
-    part_1_answer = part_1(input_list)
-    print(f"Part 1 result: {part_1_answer}")
-    part_1_updated_answer = part_1_updated(input_list)
-    print(f"Part 1 updated result: {part_1_updated_answer}")
-
-    part_2_answer = part_2(input_list)
-    print(f"Part 2 result: {part_2_answer}")
+    run_day(2)
 
 
 if __name__ == "__main__":
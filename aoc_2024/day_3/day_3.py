@@ -21,7 +21,7 @@ Scan the corrupted memory for uncorrupted mul instructions. What do you get if y
 
 import re
 
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
 
 
 def _extract_mults(code_text: str) -> int:
@@ -48,12 +48,7 @@ def part_2(code_text: str) -> int:
 
 
 def main():
-    raw_input = load_input()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
+    run_day(3)
 
 
 if __name__ == "__main__":
@@ -67,7 +67,8 @@ Flip the word search from the instructions back over to the word search side and
 
 import dataclasses
 
-from aoc_2024.utils import load_input
+from aoc_2024.grid import Grid
+from aoc_2024.runner import run_day
 
 
 @dataclasses.dataclass
@@ -76,91 +77,50 @@ class Index:
     y: int
 
 
-RANGE_OF_IDXS_T = list[tuple[int, int]]
-SEARCH_IDX_T = list[RANGE_OF_IDXS_T]
-INPUT_MATRIX_T = list[list[str]]
-
-
-def crossword_indices(start_x: int, start_y: int) -> SEARCH_IDX_T:
-    """Search indices"""
-    return [
-        # Horizontal
-        [(start_x, start_y + shift) for shift in range(4)],
-        [(start_x, start_y - shift) for shift in range(4)],
-        # Vertical
-        [(start_x + shift, start_y) for shift in range(4)],
-        [(start_x - shift, start_y) for shift in range(4)],
-        # Diagonals
-        [(start_x + shift, start_y + shift) for shift in range(4)],
-        [(start_x + shift, start_y - shift) for shift in range(4)],
-        [(start_x - shift, start_y + shift) for shift in range(4)],
-        [(start_x - shift, start_y - shift) for shift in range(4)],
-    ]
-
-
-def _retrieve_text_for_range(
-    input_matrix: INPUT_MATRIX_T, range_of_idxs: RANGE_OF_IDXS_T
-) -> str:
-    try:
-        text_list = [
-            input_matrix[x][y] if x >= 0 and y >= 0 else "" for x, y in range_of_idxs
-        ]
-        return "".join(text_list)
-    except IndexError:
-        return ""
-
-
-def part_1(input_matrix: list[list[str]]) -> int:
+# Far enough to look three letters past any cell without a bounds check
+PADDING = 3
+
+
+def parse(raw_input: str) -> Grid:
+    return Grid.from_text(raw_input, pad=PADDING)
+
+
+def part_1(grid: Grid) -> int:
+    cells = grid.cells
+    m, a, s = ord("M"), ord("A"), ord("S")
+
     total_xmases = 0
-    for i, row in enumerate(input_matrix):
-        for j, col in enumerate(row):
-            if col == "X":
-                idxs_to_search = crossword_indices(i, j)
-                for _range in idxs_to_search:
-                    text = _retrieve_text_for_range(input_matrix, _range)
-                    if text == "XMAS":
-                        total_xmases += 1
+    for idx in grid.find_all("X"):
+        for offset in grid.offsets_8:
+            if (
+                cells[idx + offset] == m
+                and cells[idx + 2 * offset] == a
+                and cells[idx + 3 * offset] == s
+            ):
+                total_xmases += 1
 
     return total_xmases
 
 
-GOOD_MAS = {"MAS", "SAM"}
-
+GOOD_MAS = {(ord("M"), ord("S")), (ord("S"), ord("M"))}
 
-def indices_x(
-    input_matrix: INPUT_MATRIX_T, start_x: int, start_y: int
-) -> tuple[str, str]:
-    crosses = [
-        [(start_x - 1, start_y - 1), (start_x, start_y), (start_x + 1, start_y + 1)],
-        [(start_x + 1, start_y - 1), (start_x, start_y), (start_x - 1, start_y + 1)],
-    ]
-    texts = [_retrieve_text_for_range(input_matrix, _range) for _range in crosses]
-    return texts[0], texts[1]
 
+def part_2(grid: Grid) -> int:
+    cells = grid.cells
+    stride = grid.stride
 
-def part_2(input_matrix: list[list[str]]) -> int:
     total_x_mases = 0
-    for i, row in enumerate(input_matrix):
-        for j, col in enumerate(row):
-            if col == "A":
-                text_a, text_b = indices_x(input_matrix, i, j)
-                if text_a in GOOD_MAS and text_b in GOOD_MAS:
-                    total_x_mases += 1
+    for idx in grid.find_all("A"):
+        falling = (cells[idx - stride - 1], cells[idx + stride + 1])
+        rising = (cells[idx + stride - 1], cells[idx - stride + 1])
+        if falling in GOOD_MAS and rising in GOOD_MAS:
+            total_x_mases += 1
 
     return total_x_mases
 
 
 def main():
-    raw_input = load_input()
-    input_list = raw_input.split("\n")
-    input_matrix = []
-    for row in input_list:
-        input_matrix.append(list(row))
-    part_1_answer = part_1(input_matrix)
-    print(f"Part 1 result: {part_1_answer}")
-
-    part_2_answer = part_2(input_matrix)
-    print(f"Part 2 result: {part_2_answer}")
+    run_day(4)
 
 
 if __name__ == "__main__":
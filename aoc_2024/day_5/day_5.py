@@ -89,11 +89,10 @@ Find the updates which are not in the correct order. What do you get if you add
 """
 
 import dataclasses
-import time
 from collections import defaultdict
 from typing import Dict, List
 
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
 
 
 @dataclasses.dataclass
@@ -117,6 +116,20 @@ def generate_ordering_rules_dict(ordering_rules: List[str]) -> Dict[str, set]:
     return ordering_rules_dict
 
 
+@dataclasses.dataclass
+class SafetyManual:
+    ordering_rules: Dict[str, set]
+    updates: List[List[str]]
+
+
+def parse(raw_input: str) -> SafetyManual:
+    input_obj = parse_raw_input(raw_input)
+    return SafetyManual(
+        generate_ordering_rules_dict(input_obj.ordering_rules),
+        [x.split(",") for x in input_obj.updates],
+    )
+
+
 def check_update(ordering_rules: Dict[str, set], update_list: List[str]) -> int:
     """Returns the middle number if it's a correct update, 0 if it's not"""
 
@@ -127,11 +140,9 @@ def check_update(ordering_rules: Dict[str, set], update_list: List[str]) -> int:
     return int(update_list[len(update_list) // 2])
 
 
-def part_1(raw_input: str) -> int:
-    input_obj = parse_raw_input(raw_input)
-
-    ordering_rules = generate_ordering_rules_dict(input_obj.ordering_rules)
-    updates = [x.split(",") for x in input_obj.updates]
+def part_1(manual: SafetyManual) -> int:
+    ordering_rules = manual.ordering_rules
+    updates = manual.updates
 
     total = 0
     for update in updates:
@@ -159,11 +170,9 @@ def fix_update(ordering_rules: Dict[str, set], update_list: List[str]) -> List[s
     return [x.page_number for x in sorted(self_updating_list)]
 
 
-def part_2(raw_input: str) -> int:
-    input_obj = parse_raw_input(raw_input)
-
-    ordering_rules = generate_ordering_rules_dict(input_obj.ordering_rules)
-    updates = [x.split(",") for x in input_obj.updates]
+def part_2(manual: SafetyManual) -> int:
+    ordering_rules = manual.ordering_rules
+    updates = manual.updates
 
     bad_updates = []
     for update in updates:
@@ -180,20 +189,7 @@ def part_2(raw_input: str) -> int:
 
 
 def main():
-    raw_input = load_input()
-    # raw_input = example_input
-
-    start_time = time.time()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-    end_time = time.time()
-    print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-    start_time = time.time()
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
-    end_time = time.time()
-    print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(5)
 
 
 if __name__ == "__main__":
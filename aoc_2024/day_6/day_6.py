@@ -175,18 +175,14 @@ It doesn't really matter what you choose to use as an obstacle so long as you an
 You need to get the guard stuck in a loop by adding a single new obstruction. How many different positions could you choose for this obstruction?
 """
 
-import concurrent.futures
 import dataclasses
-import time
-from concurrent.futures.process import ProcessPoolExecutor
-from copy import deepcopy
-from enum import Enum
-from typing import List
-
-from tqdm import tqdm
-
-from aoc_2024.utils import load_input
+import sys
+from enum import StrEnum
+from typing import Callable, Dict, Iterator, List, Protocol, Tuple
 
+from aoc_2024.grid import Grid
+from aoc_2024.runner import run_day
+from aoc_2024.utils import max_workers
 
 example_input = """....#.....
 .........#
@@ -199,153 +195,555 @@ example_input = """....#.....
 #.........
 ......#..."""
 
+OBSTACLE = ord("#")
+FREE = ord(".")
+# Jump table entry for walking off the map
+EXIT = -1
+# Part 2 candidates are split into this many chunks per worker, enough to
+# even out the slow ones without a task per candidate
+CHUNKS_PER_WORKER = 4
 
-@dataclasses.dataclass
-class Position:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash(f"{self.x},{self.y}")
+# A guard state is one int, ``cell * 4 + direction``, where ``cell`` is a flat
+# board index and ``direction`` an index into ``board.offsets_4`` (clockwise
+# from north), so turning right is ``(direction + 1) & 3``
+NORTH = 0
 
 
-class Direction(Enum):
-    NORTH = Position(-1, 0)
-    EAST = Position(0, 1)
-    SOUTH = Position(1, 0)
-    WEST = Position(0, -1)
+def find_start(board: Grid) -> int | None:
+    start = board.find("^")
+    if start == -1:
+        return None
+    return start * 4 + NORTH
 
 
 @dataclasses.dataclass
-class GuardPosition:
-    position: Position
-    direction: Direction
-
-    def __hash__(self) -> int:
-        return hash(
-            f"{self.position.x},{self.position.y},{self.direction.value.x},{self.direction.value.y}"
+class Lab:
+    board: Grid
+    start: int | None
+
+
+def parse(raw_input: str) -> Lab:
+    board = Grid.from_text(raw_input)
+    return Lab(board, find_start(board))
+
+
+class PatrolEventKind(StrEnum):
+    # Moved onto the cell ahead, or started out on a cell
+    STEP = "step"
+    # Turned right on the spot
+    TURN = "turn"
+    # About to walk off the map, the patrol is over
+    EXIT = "exit"
+    # Back in a state it has already been in, the patrol never ends
+    LOOP = "loop"
+
+
+# What happened and the guard's state once it had. A plain tuple rather than a
+# NamedTuple, which costs several times more to build once per step.
+PatrolEvent = Tuple[PatrolEventKind, int]
+
+
+def iter_patrol(
+    board: Grid, start: int, obstruction: int | None = None
+) -> Iterator[PatrolEvent]:
+    """Lazily walk the guard from ``start``, one event per move, optionally with
+    an extra obstacle at cell ``obstruction``.
+
+    Begins with a ``STEP`` in ``start`` and finishes with an ``EXIT`` or a
+    ``LOOP``; stop iterating as soon as you know enough, e.g. whether the guard
+    ever gets to ``cell``::
+
+        any(state >> 2 == cell for _, state in iter_patrol(board, start))
+
+    A loop has to come back round to a turn it has taken before, so only turn
+    states are remembered.
+    """
+    step, turn = PatrolEventKind.STEP, PatrolEventKind.TURN
+    cells = board.cells
+    offsets = board.offsets_4
+    cell, direction = start >> 2, start & 3
+    turns = set()
+
+    yield step, start
+    while True:
+        ahead = cell + offsets[direction]
+        value = cells[ahead]
+        if value == board.fill:
+            yield PatrolEventKind.EXIT, cell * 4 + direction
+            return
+
+        if value == OBSTACLE or ahead == obstruction:
+            direction = (direction + 1) & 3
+            state = cell * 4 + direction
+            if state in turns:
+                yield PatrolEventKind.LOOP, state
+                return
+            turns.add(state)
+            yield turn, state
+        else:
+            cell = ahead
+            yield step, cell * 4 + direction
+
+
+def part_1(lab: Lab) -> int:
+    if lab.start is None:
+        return 0
+
+    visited = bytearray(len(lab.board.cells))
+    for _, state in iter_patrol(lab.board, lab.start):
+        visited[state >> 2] = 1
+    return visited.count(1)
+
+
+def build_jumps(board: Grid) -> List[List[int]]:
+    """``jumps[direction][idx]`` is the cell the guard stops on when walking from
+    ``idx`` in ``direction`` until the next obstacle, ``EXIT`` if nothing stops
+    it before the edge. Filled in for every real cell, obstacles included."""
+    cells = board.cells
+    real_cells = list(board.indices())
+    jumps = [[EXIT] * len(cells) for _ in board.offsets_4]
+    for direction, offset in enumerate(board.offsets_4):
+        jump = jumps[direction]
+        # The cell ahead has to be filled in before the ones behind it
+        for idx in real_cells if offset < 0 else reversed(real_cells):
+            ahead = cells[idx + offset]
+            if ahead == OBSTACLE:
+                jump[idx] = idx
+            elif ahead != board.fill:
+                jump[idx] = jump[idx + offset]
+    return jumps
+
+
+def turn_states(
+    board: Grid, jumps: List[List[int]], state: int, obstruction: int
+) -> Iterator[int]:
+    """The state the guard starting in ``state`` is in at every turn once an
+    obstacle is added at ``obstruction``, until it walks off the map.
+
+    Jumps straight from turn to turn. Never ends if the guard loops.
+    """
+    stride = board.stride
+    offsets = board.offsets_4
+    obstruction_row, obstruction_col = divmod(obstruction, stride)
+
+    position, direction = state >> 2, state & 3
+    while True:
+        offset = offsets[direction]
+        stop = jumps[direction][position]
+
+        # The table doesn't know about the obstruction, stop short of it if
+        # it's on the way. North and south are even, east and west odd.
+        if (
+            position % stride == obstruction_col
+            if direction & 1 == 0
+            else position // stride == obstruction_row
+        ):
+            distance = (obstruction - position) // offset
+            if distance > 0 and (
+                stop == EXIT or distance <= (stop - position) // offset
+            ):
+                stop = obstruction - offset
+
+        if stop == EXIT:
+            return
+
+        yield stop * 4 + direction
+
+        position = stop
+        direction = (direction + 1) & 3
+
+
+class LoopDetector(Protocol):
+    def loops(self, turns: Iterator[int]) -> bool:
+        """Whether ``turns`` ever comes back to a turn state it already had"""
+        ...
+
+
+class VisitedStates:
+    """Loop detector remembering turn states in a bytearray with a byte per
+    possible state, reused across walks.
+
+    A state has been seen when its byte holds the current generation, so
+    starting a walk is bumping the generation rather than reallocating; the
+    bytes only need zeroing every 255 walks. Fastest, but four bytes per cell.
+    """
+
+    def __init__(self, board: Grid) -> None:
+        self.marks = bytearray(len(board.cells) * 4)
+        self.generation = 0
+
+    def next_generation(self) -> int:
+        self.generation += 1
+        if self.generation == 256:
+            self.marks[:] = bytes(len(self.marks))
+            self.generation = 1
+        return self.generation
+
+    def loops(self, turns: Iterator[int]) -> bool:
+        marks = self.marks
+        generation = self.next_generation()
+        for turn_state in turns:
+            if marks[turn_state] == generation:
+                return True
+            marks[turn_state] = generation
+        return False
+
+
+class TurnSet:
+    """Loop detector remembering turn states in a set, so memory grows with the
+    number of turns taken rather than the size of the board"""
+
+    def __init__(self, board: Grid) -> None:
+        pass
+
+    def loops(self, turns: Iterator[int]) -> bool:
+        seen = set()
+        for turn_state in turns:
+            if turn_state in seen:
+                return True
+            seen.add(turn_state)
+        return False
+
+
+class Brent:
+    """Loop detector using Brent's algorithm on the turn states, constant memory.
+
+    The tortoise waits on a state while the hare goes ``power`` turns past it,
+    then jumps to the hare and ``power`` doubles, so a loop is noticed within
+    about twice its length of going round it.
+    """
+
+    def __init__(self, board: Grid) -> None:
+        pass
+
+    def loops(self, turns: Iterator[int]) -> bool:
+        tortoise = -1
+        power = 1
+        steps = 0
+        for turn_state in turns:
+            if turn_state == tortoise:
+                return True
+            steps += 1
+            if steps == power:
+                tortoise = turn_state
+                power *= 2
+                steps = 0
+        return False
+
+
+# Ways of spotting a loop, for part 2's ``detector``
+DETECTORS: Dict[str, Callable[[Grid], LoopDetector]] = {
+    "bitmap": VisitedStates,
+    "turns": TurnSet,
+    "brent": Brent,
+}
+
+
+def find_loops(
+    board: Grid,
+    jumps: List[List[int]],
+    candidates: List[Tuple[int, int]],
+    detector: str = "bitmap",
+) -> List[bool]:
+    """Whether each ``(obstruction, state to start from)`` candidate loops"""
+    loop_detector = DETECTORS[detector](board)
+    return [
+        loop_detector.loops(turn_states(board, jumps, state, candidate))
+        for candidate, state in candidates
+    ]
+
+
+# Each pool worker's board and jump table, set once by _init_worker so the
+# tasks only carry their candidates
+_worker_board: Grid | None = None
+_worker_jumps: List[List[int]] | None = None
+_worker_detector = "bitmap"
+
+
+def _init_worker(board: Grid, detector: str) -> None:
+    global _worker_board, _worker_jumps, _worker_detector
+    _worker_board = board
+    _worker_jumps = build_jumps(board)
+    _worker_detector = detector
+
+
+def _find_loops_in_chunk(candidates: List[Tuple[int, int]]) -> List[bool]:
+    assert _worker_board is not None and _worker_jumps is not None, (
+        "_init_worker hasn't run in this process"
+    )
+    return find_loops(_worker_board, _worker_jumps, candidates, _worker_detector)
+
+
+def find_loops_parallel(
+    board: Grid,
+    candidates: List[Tuple[int, int]],
+    workers: int,
+    detector: str = "bitmap",
+) -> List[bool]:
+    """``find_loops`` spread over a process pool in a few chunks per worker"""
+    import concurrent.futures
+    from concurrent.futures.process import ProcessPoolExecutor
+
+    from tqdm import tqdm
+
+    chunk_size = max(1, -(-len(candidates) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [
+        candidates[i : i + chunk_size] for i in range(0, len(candidates), chunk_size)
+    ]
+
+    with tqdm(total=len(candidates)) as pbar:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(board, detector),
+        ) as executor:
+            futures = {
+                executor.submit(_find_loops_in_chunk, chunk): len(chunk)
+                for chunk in chunks
+            }
+            for future in concurrent.futures.as_completed(futures):
+                pbar.update(futures[future])
+
+    # Dicts keep insertion order, so this is the order of the candidates
+    return [loops for future in futures for loops in future.result()]
+
+
+def find_loops_numpy(
+    board: Grid, jumps: List[List[int]], candidates: List[Tuple[int, int]]
+) -> List[bool]:
+    """``find_loops`` for every candidate at once: one guard per candidate, all
+    stepped turn to turn in lockstep with NumPy.
+
+    Guards drop out as they walk off the map or loop. Loops are spotted with
+    Brent's algorithm on each guard's turn states, which needs a few ints per
+    guard rather than a set of states each.
+    """
+    import numpy as np
+
+    if not candidates:
+        return []
+
+    stride = board.stride
+    jumps_array = np.array(jumps, dtype=np.int64)
+    offsets = np.array(board.offsets_4, dtype=np.int64)
+
+    obstruction, state = np.array(candidates, dtype=np.int64).T
+    position, direction = state >> 2, state & 3
+    obstruction_row, obstruction_col = np.divmod(obstruction, stride)
+    # Brent: the hare is the current turn state, the tortoise jumps to it
+    # every time the hare has gone ``power`` turns, and ``power`` doubles
+    tortoise = np.full_like(state, -1)
+    power = np.ones_like(state)
+    turns = np.zeros_like(state)
+    # Which candidate each remaining guard is
+    guard = np.arange(len(candidates))
+
+    loops = np.zeros(len(candidates), dtype=bool)
+    while len(position):
+        offset = offsets[direction]
+        stop = jumps_array[direction, position]
+
+        # Stop short of each guard's own obstruction if it's on the way
+        aligned = np.where(
+            direction & 1 == 0,
+            position % stride == obstruction_col,
+            position // stride == obstruction_row,
+        )
+        distance = (obstruction - position) // offset
+        blocked = (
+            aligned
+            & (distance > 0)
+            & ((stop == EXIT) | (distance <= (stop - position) // offset))
+        )
+        stop = np.where(blocked, obstruction - offset, stop)
+
+        turn_state = stop * 4 + direction
+        exited = stop == EXIT
+        looped = ~exited & (turn_state == tortoise)
+        loops[guard[looped]] = True
+
+        turns += 1
+        catch_up = turns == power
+        tortoise = np.where(catch_up, turn_state, tortoise)
+        power = np.where(catch_up, power * 2, power)
+        turns = np.where(catch_up, 0, turns)
+
+        walking = ~(exited | looped)
+        position = stop[walking]
+        direction = (direction[walking] + 1) & 3
+        obstruction = obstruction[walking]
+        obstruction_row = obstruction_row[walking]
+        obstruction_col = obstruction_col[walking]
+        tortoise = tortoise[walking]
+        power = power[walking]
+        turns = turns[walking]
+        guard = guard[walking]
+
+    return loops.tolist()
+
+
+# Ways of trying many obstructions at once
+ENGINES = ("python", "numpy")
+
+
+class PatrolIndex:
+    """Answers "would an obstruction here trap the guard?" for one board.
+
+    Built once from the board's jump table and the guard's route. An
+    obstruction off the route is never bumped into, so it can't change
+    anything, and up to the guard's first step onto it nothing changes either,
+    so one on the route is tried from the state just before that step.
+
+    Permanent obstacles can be added and removed: that patches the jump table
+    along the obstacle's row and column, and the route is walked again the
+    next time it is needed.
+    """
+
+    def __init__(self, board: Grid, start: int, detector: str = "bitmap") -> None:
+        if detector not in DETECTORS:
+            raise ValueError(
+                f"Unknown detector {detector!r}, expected one of {tuple(DETECTORS)}"
+            )
+        # Our own copy, as obstacles get added to it
+        self.board = board.copy()
+        self.start = start
+        self.detector = detector
+        self.jumps = build_jumps(self.board)
+        self._loop_detector = DETECTORS[detector](self.board)
+        self._resume_from: Dict[int, int] | None = None
+        self._route_loops = False
+
+    def _walk_route(self) -> Dict[int, int]:
+        route = []
+        for kind, state in iter_patrol(self.board, self.start):
+            if kind is PatrolEventKind.STEP or kind is PatrolEventKind.TURN:
+                route.append(state)
+        # Obstacles added here can leave the guard going round without help
+        self._route_loops = kind is PatrolEventKind.LOOP
+
+        start_cell = self.start >> 2
+        resume_from: Dict[int, int] = {}
+        for state, previous in zip(route[1:], route):
+            cell = state >> 2
+            if cell != start_cell and cell not in resume_from:
+                resume_from[cell] = previous
+        return resume_from
+
+    @property
+    def resume_from(self) -> Dict[int, int]:
+        """Every cell on the route bar the start, mapped to the state just
+        before the guard first steps onto it"""
+        if self._resume_from is None:
+            self._resume_from = self._walk_route()
+        return self._resume_from
+
+    def _cell(self, pos: Tuple[int, int]) -> int:
+        row, col = pos
+        if not (0 <= row < self.board.height and 0 <= col < self.board.width):
+            raise ValueError(f"{pos} is off the board")
+        return self.board.index(row, col)
+
+    def candidates(self) -> List[Tuple[int, int]]:
+        """``(row, col)`` of every cell an obstruction could make a difference on"""
+        return [self.board.coords(cell) for cell in self.resume_from]
+
+    def creates_loop(self, pos: Tuple[int, int]) -> bool:
+        cell = self._cell(pos)
+        state = self.resume_from.get(cell)
+        if state is None:
+            return self._route_loops
+        return self._loop_detector.loops(
+            turn_states(self.board, self.jumps, state, cell)
         )
 
-
-def turn(direction: Direction) -> Direction:
-    match direction:
-        case Direction.NORTH:
-            return Direction.EAST
-        case Direction.EAST:
-            return Direction.SOUTH
-        case Direction.SOUTH:
-            return Direction.WEST
-        case Direction.WEST:
-            return Direction.NORTH
-
-
-def move(board: List[List[str]], guard_position: GuardPosition) -> GuardPosition | None:
-    new_x = guard_position.position.x + guard_position.direction.value.x
-    new_y = guard_position.position.y + guard_position.direction.value.y
-
-    # If we leave the board - return None
-    if new_x >= len(board) or new_x < 0 or new_y >= len(board[new_x]) or new_y < 0:
-        return None
-
-    if board[new_x][new_y] == "#" or board[new_x][new_y] == "O":
-        guard_position.direction = turn(guard_position.direction)
-        new_x = guard_position.position.x
-        new_y = guard_position.position.y
-
-    return GuardPosition(Position(new_x, new_y), guard_position.direction)
-
-
-def part_1(raw_input: str) -> int:
-    board = [list(x) for x in raw_input.split("\n")]
-
-    starting_position = None
-    for i, row in enumerate(board):
-        for j, col in enumerate(row):
-            if col == "^":
-                starting_position = GuardPosition(Position(i, j), Direction.NORTH)
-
-    curr_position = starting_position
-    visited_locations = set()
-    while curr_position:
-        visited_locations.add(curr_position.position)
-        curr_position = move(board, curr_position)
-
-    return len(visited_locations)
-
-
-def is_loop(board: List[List[str]], starting_position: GuardPosition) -> bool:
-    curr_position: GuardPosition | None = starting_position
-    visited_locations = set()
-    while curr_position:
-        if curr_position in visited_locations:
-            return True
-
-        visited_locations.add(curr_position)
-        curr_position = move(board, curr_position)
-
-    return False
-
-
-def is_loop_parallel(
-    board: List[List[str]], starting_pos: GuardPosition, swap_pos: Position
-) -> bool:
-    old_board_value = board[swap_pos.x][swap_pos.y]
-    board[swap_pos.x][swap_pos.y] = "O"
-    _is_loop = is_loop(board, deepcopy(starting_pos))
-    board[swap_pos.x][swap_pos.y] = old_board_value
-    return _is_loop
-
-
-def part_2(raw_input: str) -> int:
-    board = [list(x) for x in raw_input.split("\n")]
-    starting_position = None
-    for i, row in enumerate(board):
-        for j, col in enumerate(row):
-            if col == "^":
-                starting_position = GuardPosition(Position(i, j), Direction.NORTH)
-
-    if not starting_position:
+    def batch_creates_loop(
+        self, positions: List[Tuple[int, int]], engine: str = "python"
+    ) -> List[bool]:
+        """``creates_loop`` for each of ``positions``. ``engine`` is one of
+        ``ENGINES``: ``python`` tries one at a time, spread over a process pool
+        when there are cores to spare, ``numpy`` tries them all at once in
+        this process (always spotting loops with Brent's algorithm)."""
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+
+        resume_from = self.resume_from
+        results = [self._route_loops] * len(positions)
+        on_route = []
+        candidates = []
+        for i, pos in enumerate(positions):
+            cell = self._cell(pos)
+            if cell in resume_from:
+                on_route.append(i)
+                candidates.append((cell, resume_from[cell]))
+
+        workers = max_workers()
+        if engine == "numpy":
+            loops = find_loops_numpy(self.board, self.jumps, candidates)
+        elif workers == 1:
+            loops = find_loops(self.board, self.jumps, candidates, self.detector)
+        else:
+            loops = find_loops_parallel(self.board, candidates, workers, self.detector)
+
+        for i, looped in zip(on_route, loops):
+            results[i] = looped
+        return results
+
+    def add_obstacle(self, pos: Tuple[int, int]) -> None:
+        cell = self._cell(pos)
+        if cell == self.start >> 2:
+            raise ValueError(f"The guard is standing on {pos}")
+        self.board[cell] = OBSTACLE
+        for direction, offset in enumerate(self.board.offsets_4):
+            # Walking towards it from behind now stops just before it
+            self._patch_behind(cell, direction, cell - offset)
+        self._resume_from = None
+
+    def remove_obstacle(self, pos: Tuple[int, int]) -> None:
+        cell = self._cell(pos)
+        self.board[cell] = FREE
+        for direction in range(len(self.board.offsets_4)):
+            # Walking towards it from behind now carries on to wherever
+            # walking on from it ends up
+            self._patch_behind(cell, direction, self.jumps[direction][cell])
+        self._resume_from = None
+
+    def _patch_behind(self, cell: int, direction: int, stop: int) -> None:
+        """Point the cells that walk in ``direction`` into ``cell`` at ``stop``,
+        up to and including the first obstacle behind it, whose own entry
+        depends on ``cell`` but shields the cells behind it"""
+        jump = self.jumps[direction]
+        offset = self.board.offsets_4[direction]
+        behind = cell - offset
+        while self.board[behind] != self.board.fill:
+            jump[behind] = stop
+            if self.board[behind] == OBSTACLE:
+                return
+            behind -= offset
+
+
+def part_2(lab: Lab, engine: str = "python", detector: str = "bitmap") -> int:
+    """``engine`` is one of ``ENGINES`` and ``detector`` one of ``DETECTORS``,
+    see ``PatrolIndex.batch_creates_loop``. ``bitmap`` is the fastest detector,
+    ``turns`` and ``brent`` keep memory down on huge boards."""
+    if lab.start is None:
         return -1
 
-    # Try all new boards
-    unique_positions = set()
-    for i in range(len(board)):
-        for j in range(len(board)):
-            if Position(i, j) == starting_position.position or board[i][j] == "#":
-                continue
-            unique_positions.add(Position(i, j))
-
-    futures = []
-    with tqdm(total=len(unique_positions)) as pbar:
-        with ProcessPoolExecutor() as executor:
-            for unique_pos in unique_positions:
-                futures.append(
-                    executor.submit(
-                        is_loop_parallel, board, starting_position, unique_pos
-                    )
-                )
+    index = PatrolIndex(lab.board, lab.start, detector)
+    candidates = index.candidates()
 
-            for _ in concurrent.futures.as_completed(futures):
-                pbar.update()
+    board = lab.board
+    free_cells = board.height * board.width - board.cells.count(OBSTACLE) - 1
+    print(
+        f"Day 6: trying {len(candidates)} obstructions on the route, "
+        f"pruned {free_cells - len(candidates)} of {free_cells} free cells",
+        file=sys.stderr,
+    )
 
-    return len([x.result() for x in futures if x.result() is True])
+    return sum(index.batch_creates_loop(candidates, engine))
 
 
 def main():
-    raw_input = load_input()
-    # raw_input = example_input
-
-    start_time = time.time()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-    end_time = time.time()
-    print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-    start_time = time.time()
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
-    end_time = time.time()
-    print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(6)
 
 
 if __name__ == "__main__":
@@ -31,16 +31,18 @@ Determine which equations could possibly be true. What is their total calibratio
 
 """
 
-import concurrent
+import atexit
+import dataclasses
+import functools
 import itertools
-import time
-from concurrent.futures.process import ProcessPoolExecutor
-from functools import cache
-from typing import List
+import operator
+from typing import TYPE_CHECKING, AbstractSet, Callable, Dict, List, Sequence, Set
 
-from tqdm import tqdm
+from aoc_2024.runner import run_day
+from aoc_2024.utils import max_workers
 
-from aoc_2024.utils import load_input
+if TYPE_CHECKING:
+    from concurrent.futures.process import ProcessPoolExecutor
 
 
 example_input = """190: 10 19
@@ -53,115 +55,420 @@ example_input = """190: 10 19
 21037: 9 7 18 13
 292: 11 6 16 20"""
 
-OPERATORS = ["*", "+"]
-NEW_OPERATORS = ["*", "+", "||"]
+
+def digits(value: int) -> int:
+    return len(str(value))
 
 
-def fill_place_holders(operand_list: List[str]) -> str:
-    operands = operand_list.copy()
-    if len(operands) == 2:
-        return operands[0] + " _ " + operands[1]
+def concat(left: int, right: int) -> int:
+    return left * 10 ** digits(right) + right
 
-    new_first_operand = operands[0] + " _ " + operands[1]
-    operands[0] = new_first_operand
-    operands.pop(1)
-    return fill_place_holders(operands)
 
+# The inverses give the left operand that turns into ``result`` with ``right``,
+# None if there is none. Operands are positive.
+def _unadd(result: int, right: int) -> int | None:
+    return result - right if result >= right else None
 
-@cache
-def dont_do_pemdas(original_equation: str) -> int:
-    equation = original_equation.split(" ")
-    if len(equation) == 3:
-        if equation[1] == "||":
-            return int(equation[0] + equation[2])
 
-        return eval("".join(equation))
+def _unmultiply(result: int, right: int) -> int | None:
+    return result // right if right and result % right == 0 else None
 
-    first_part = str(dont_do_pemdas(" ".join(equation[0:3])))
 
-    equation[0] = first_part
-    equation.pop(1)
-    equation.pop(1)
-    return dont_do_pemdas(" ".join(equation))
+def _unconcat(result: int, right: int) -> int | None:
+    scale = 10 ** digits(right)
+    return result // scale if result % scale == right else None
 
 
-def is_possible(total: int, operands: List[str], operators: List[str]) -> int:
-    # Number of places an operation can go
-    num_choices = len(operands) - 1
-    # List of operations with "_" filled in between them
-    place_holders_list = fill_place_holders(operands).split(" ")
+@dataclasses.dataclass(frozen=True)
+class Operator:
+    apply: Callable[[int, int], int]
+    undo: Callable[[int, int], int | None]
 
-    # n different combos of "*" and "+" where n=number of spots available
-    combos = itertools.product(operators, repeat=num_choices)
-    # Try every combo of * and +
-    for combo in combos:
-        num_inserted = 0
 
-        # Replace the placeholder (or last operation) with the new operation
-        for choice in range(num_choices):
-            place_holders_list[choice + num_inserted + 1] = combo[choice]
-            num_inserted += 1
+OPERATOR_TABLE: Dict[str, Operator] = {
+    "+": Operator(operator.add, _unadd),
+    "*": Operator(operator.mul, _unmultiply),
+    "||": Operator(concat, _unconcat),
+}
 
-        # Turn them into an equation list
-        equation_str = " ".join(place_holders_list)
-        if dont_do_pemdas(equation_str) == int(total):
+OPERATORS = ["*", "+"]
+NEW_OPERATORS = ["*", "+", "||"]
+# Each tier only adds operators to the one before, so anything one tier can
+# solve every later one can too
+TIERS = (OPERATORS, NEW_OPERATORS)
+
+
+@dataclasses.dataclass
+class Equation:
+    total: int
+    operands: List[int]
+
+
+def parse(raw_input: str) -> List[Equation]:
+    equations = []
+    for equation in raw_input.split("\n"):
+        split_eq = equation.split(": ")
+        equations.append(
+            Equation(int(split_eq[0]), [int(x) for x in split_eq[1].split(" ")])
+        )
+    return equations
+
+
+def evaluate(operands: List[int], operators: Sequence[str]) -> int:
+    """Left to right, no precedence: ``operators[i]`` goes between
+    ``operands[i]`` and ``operands[i + 1]``"""
+    result = operands[0]
+    for symbol, operand in zip(operators, operands[1:]):
+        result = OPERATOR_TABLE[symbol].apply(result, operand)
+    return result
+
+
+def is_possible_brute_force(
+    total: int, operands: List[int], operators: List[str]
+) -> int:
+    """``is_possible`` by trying every combination of operators"""
+    for combo in itertools.product(operators, repeat=len(operands) - 1):
+        if evaluate(operands, combo) == total:
             return total
     return 0
 
 
-def part_1(raw_input: str) -> int:
-    list_of_equations = raw_input.split("\n")
-
-    futures = []
-    with tqdm(total=len(list_of_equations)) as pbar:
-        with ProcessPoolExecutor() as executor:
-            for equation in list_of_equations:
-                split_eq = equation.split(": ")
-                total = int(split_eq[0])
-                operands = split_eq[1].split(" ")
-                futures.append(executor.submit(is_possible, total, operands, OPERATORS))
-
-            for _ in concurrent.futures.as_completed(futures):
-                pbar.update()
-
-    return sum([x.result() for x in futures])
-
-
-def part_2(raw_input: str) -> int:
-    list_of_equations = raw_input.split("\n")
-
-    futures = []
-    with tqdm(total=len(list_of_equations)) as pbar:
-        with ProcessPoolExecutor() as executor:
-            for equation in list_of_equations:
-                split_eq = equation.split(": ")
-                total = int(split_eq[0])
-                operands = split_eq[1].split(" ")
-                futures.append(
-                    executor.submit(is_possible, total, operands, NEW_OPERATORS)
-                )
+def is_possible(total: int, operands: List[int], operators: List[str]) -> int:
+    """Returns ``total`` if some choice of ``operators`` makes the equation true,
+    0 if none does.
+
+    Works right to left from the total: the last operand was added, multiplied
+    or concatenated onto whatever the rest came to, so undo it each way that
+    can work (subtract it, divide by it if it divides, strip it off if the
+    total ends in its digits) and carry on with the rest. Most branches die
+    straight away instead of trying every combination.
+    """
+    undos = [OPERATOR_TABLE[symbol].undo for symbol in operators]
+
+    # (what operands[: i + 1] have to come to, i), depth first. A stack rather
+    # than recursion so long equations don't run out of frames.
+    stack = [(total, len(operands) - 1)]
+    while stack:
+        target, i = stack.pop()
+        value = operands[i]
+        if i == 0:
+            if target == value:
+                return total
+            continue
+        for undo in undos:
+            rest = undo(target, value)
+            if rest is not None:
+                stack.append((rest, i - 1))
+    return 0
 
-            for _ in concurrent.futures.as_completed(futures):
-                pbar.update()
 
-    return sum([x.result() for x in futures])
+def is_possible_forward(total: int, operands: List[int], operators: List[str]) -> int:
+    """``is_possible`` working left to right, keeping the set of values the
+    operands so far can come to.
+
+    Every operator only ever grows a value, so anything past the total is
+    dropped, and equal prefixes are only carried forward once. The set lives
+    only as long as the call.
+    """
+    applies = [OPERATOR_TABLE[symbol].apply for symbol in operators]
+    prefixes = {operands[0]} if operands[0] <= total else set()
+    for operand in operands[1:]:
+        prefixes = {
+            value
+            for prefix in prefixes
+            for apply in applies
+            if (value := apply(prefix, operand)) <= total
+        }
+        if not prefixes:
+            return 0
+    return total if total in prefixes else 0
+
+
+# Ways of checking a single equation
+SOLVERS: Dict[str, Callable[[int, List[int], List[str]], int]] = {
+    "backward": is_possible,
+    "forward": is_possible_forward,
+    "brute_force": is_possible_brute_force,
+}
+
+
+# Vectorised ``OPERATOR_TABLE`` applies, taking the prefixes, the operands and
+# ``10 ** digits(operand)`` for each
+NUMPY_APPLIES: Dict[str, Callable] = {
+    "+": lambda prefix, operand, scale: prefix + operand,
+    "*": lambda prefix, operand, scale: prefix * operand,
+    "||": lambda prefix, operand, scale: prefix * scale + operand,
+}
+INT64_LIMIT = 2**63
+# Equations per batch of ``check_numpy``, and the most prefixes a batch keeps
+# at once before it is split up
+NUMPY_BATCH = 512
+FRONTIER_LIMIT = 2**16
+
+
+def _frontier_possible(
+    batch: List[Equation], operators: List[str]
+) -> tuple[List[bool], List[int]]:
+    """``check_numpy`` for one batch whose prefixes all fit in an int64.
+    Also returns which of ``batch`` had too many prefixes to check."""
+    import numpy as np
+
+    lengths = np.array([len(equation.operands) for equation in batch])
+    totals = np.array([equation.total for equation in batch], dtype=np.int64)
+    width = int(lengths.max())
+    # Padded out to the longest equation; the padding is never read
+    operands = np.zeros((len(batch), width), dtype=np.int64)
+    for row, equation in enumerate(batch):
+        operands[row, : len(equation.operands)] = equation.operands
+    scales = 10 ** np.char.str_len(operands.astype(str)).astype(np.int64)
+    applies = [NUMPY_APPLIES[symbol] for symbol in operators]
+
+    possible = np.zeros(len(batch), dtype=bool)
+    too_many: List[int] = []
+    # Which equation each prefix belongs to
+    owner = np.arange(len(batch))
+    prefix = operands[:, 0]
+    keep = prefix <= totals
+    # Prefixes still to carry on from their ``k``th operand. Frontiers that
+    # would grow past FRONTIER_LIMIT are split in two by equation.
+    pending = [(1, owner[keep], prefix[keep])]
+    while pending:
+        k, owner, prefix = pending.pop()
+        while k < width:
+            finished = lengths[owner] == k
+            possible[owner[finished & (prefix == totals[owner])]] = True
+            owner, prefix = owner[~finished], prefix[~finished]
+            if not len(owner):
+                break
+
+            if len(owner) * len(applies) > FRONTIER_LIMIT:
+                remaining = np.unique(owner)
+                if len(remaining) == 1:
+                    too_many.append(int(remaining[0]))
+                    owner, prefix = owner[:0], prefix[:0]
+                    break
+                first_half = owner < remaining[len(remaining) // 2]
+                pending.append((k, owner[~first_half], prefix[~first_half]))
+                owner, prefix = owner[first_half], prefix[first_half]
+                continue
+
+            operand, scale = operands[owner, k], scales[owner, k]
+            prefix = np.concatenate(
+                [apply(prefix, operand, scale) for apply in applies]
+            )
+            owner = np.tile(owner, len(applies))
+            keep = prefix <= totals[owner]
+            owner, prefix = owner[keep], prefix[keep]
+            k += 1
+        # What's left used every operand of the longest equations
+        possible[owner[prefix == totals[owner]]] = True
+
+    return possible.tolist(), too_many
+
+
+def check_numpy(
+    equations: List[Equation], indexes: List[int], operators: List[str], solver: str
+) -> List[bool]:
+    """Whether each of ``equations[indexes]`` can be made true, working out
+    ``is_possible_forward``'s prefixes for a batch of them at once with NumPy.
+
+    The prefixes of a batch of equations live in one flat int64 array, next to
+    the equation each belongs to. Each step applies every operator to all of
+    them, drops whatever went past its total, and an equation is possible if
+    its total is among the prefixes once its last operand is used.
+
+    ``solver`` checks, one at a time with Python ints, the equations whose
+    prefixes could overflow an int64 (prefixes are never over the total, so
+    that's when the total times the biggest ``10 ** digits(operand)`` doesn't
+    fit) and any single equation with more than FRONTIER_LIMIT prefixes.
+    """
+    results = [False] * len(indexes)
+    fits = []
+    for position, i in enumerate(indexes):
+        equation = equations[i]
+        largest = max(equation.operands)
+        if equation.total * 10 ** digits(largest) + largest < INT64_LIMIT:
+            fits.append(position)
+        else:
+            results[position] = (
+                SOLVERS[solver](equation.total, equation.operands, operators) != 0
+            )
+
+    for start in range(0, len(fits), NUMPY_BATCH):
+        positions = fits[start : start + NUMPY_BATCH]
+        batch = [equations[indexes[position]] for position in positions]
+        possible, too_many = _frontier_possible(batch, operators)
+        for position, result in zip(positions, possible):
+            results[position] = result
+        for row in too_many:
+            equation = batch[row]
+            results[positions[row]] = (
+                SOLVERS[solver](equation.total, equation.operands, operators) != 0
+            )
+    return results
+
+
+# Ways of checking many equations at once
+ENGINES = ("python", "numpy")
+
+
+# Pending equations are mapped over the pool in this many chunks per worker
+CHUNKS_PER_WORKER = 4
+
+# One pool kept alive across tiers and parts, its workers holding a copy of
+# the equations from when it started. It is only reused while the equations
+# still match that copy, and the runner calls teardown once the day is done.
+_pool: "ProcessPoolExecutor | None" = None
+_pool_key: tuple | None = None
+# Each pool worker's copy of the equations
+_worker_equations: List[Equation] = []
+
+
+def _init_worker(equations: List[Equation]) -> None:
+    global _worker_equations
+    _worker_equations = equations
+
+
+def _check_in_worker(i: int, operators: List[str], solver: str) -> bool:
+    equation = _worker_equations[i]
+    return SOLVERS[solver](equation.total, equation.operands, operators) != 0
+
+
+def _equations_key(equations: List[Equation]) -> tuple:
+    return tuple((equation.total, tuple(equation.operands)) for equation in equations)
+
+
+def _get_pool(equations: List[Equation], workers: int) -> "ProcessPoolExecutor":
+    from concurrent.futures.process import ProcessPoolExecutor
+
+    global _pool, _pool_key
+    key = _equations_key(equations)
+    if _pool is None or _pool_key != key:
+        shutdown_pool()
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(equations,)
+        )
+        _pool_key = key
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool, _pool_key
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = _pool_key = None
+
+
+# For callers outside the runner
+atexit.register(shutdown_pool)
+
+
+def _check(
+    equations: List[Equation],
+    indexes: List[int],
+    operators: List[str],
+    solver: str,
+    engine: str = "python",
+) -> List[bool]:
+    """Whether each of ``equations[indexes]`` can be made true"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+    if engine == "numpy":
+        return check_numpy(equations, indexes, operators, solver)
+
+    workers = max_workers()
+    if workers == 1:
+        solve = SOLVERS[solver]
+        return [
+            solve(equations[i].total, equations[i].operands, operators) != 0
+            for i in indexes
+        ]
+
+    from tqdm import tqdm
+
+    chunksize = max(1, len(indexes) // (workers * CHUNKS_PER_WORKER))
+    results = []
+    with tqdm(total=len(indexes)) as pbar:
+        possible = _get_pool(equations, workers).map(
+            functools.partial(_check_in_worker, operators=operators, solver=solver),
+            indexes,
+            chunksize=chunksize,
+        )
+        for result in possible:
+            results.append(result)
+            # Results come back a chunk at a time anyway
+            if len(results) % chunksize == 0:
+                pbar.update(chunksize)
+        pbar.update(len(results) % chunksize)
+
+    return results
+
+
+def escalate(
+    equations: List[Equation],
+    operators: List[str],
+    solved: AbstractSet[int] = frozenset(),
+    solver: str = "backward",
+    engine: str = "python",
+) -> Set[int]:
+    """Indexes of the equations ``operators`` can make true.
+
+    ``solved`` are the ones already solved with a smaller set of operators;
+    they stay solved with more, so only the rest are searched.
+    """
+    pending = [i for i in range(len(equations)) if i not in solved]
+    results = _check(equations, pending, operators, solver, engine)
+    return set(solved) | {i for i, possible in zip(pending, results) if possible}
+
+
+def solve_in_tiers(
+    equations: List[Equation],
+    tiers: Sequence[List[str]] = TIERS,
+    solver: str = "backward",
+    engine: str = "python",
+) -> List[int | None]:
+    """For each equation, the index of the first of ``tiers`` that solves it, or
+    None if none does. Each tier only searches what the earlier ones couldn't
+    solve."""
+    tier_of: List[int | None] = [None] * len(equations)
+    solved: Set[int] = set()
+    for tier, operators in enumerate(tiers):
+        newly_solved = escalate(equations, operators, solved, solver, engine) - solved
+        for i in newly_solved:
+            tier_of[i] = tier
+        solved |= newly_solved
+    return tier_of
+
+
+def part_1(
+    equations: List[Equation], solver: str = "backward", engine: str = "python"
+) -> int:
+    """``solver`` is one of ``SOLVERS`` and ``engine`` one of ``ENGINES``:
+    ``python`` checks one equation at a time with ``solver``, spread over a
+    process pool when there are cores to spare, ``numpy`` checks them all at
+    once in this process (only using ``solver`` for totals too big for int64)"""
+    solved = escalate(equations, OPERATORS, solver=solver, engine=engine)
+    return sum(equations[i].total for i in solved)
+
+
+def part_2(
+    equations: List[Equation], solver: str = "backward", engine: str = "python"
+) -> int:
+    """``solver`` and ``engine`` are as for ``part_1``. Only the equations ``*``
+    and ``+`` can't solve are searched with ``||`` as well."""
+    tier_of = solve_in_tiers(equations, TIERS, solver, engine)
+    return sum(
+        equation.total for equation, tier in zip(equations, tier_of) if tier is not None
+    )
+
+
+def teardown() -> None:
+    """Called by the runner once both parts are done"""
+    shutdown_pool()
 
 
 def main():
-    raw_input = load_input()
-    # raw_input = example_input
-
-    start_time = time.time()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-    end_time = time.time()
-    print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-    start_time = time.time()
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
-    end_time = time.time()
-    print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(7)
 
 
 if __name__ == "__main__":
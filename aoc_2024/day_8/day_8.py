@@ -77,13 +77,12 @@ Calculate the impact of the signal. How many unique locations within the bounds
 
 """
 
-import dataclasses
-import time
+import copy
 from collections import defaultdict
-from typing import List, Self
+from typing import Self
 
-
-from aoc_2024.utils import load_input
+from aoc_2024.grid import Grid
+from aoc_2024.runner import run_day
 
 
 example_input = """............
@@ -100,43 +99,29 @@ example_input = """............
 ............"""
 
 
-@dataclasses.dataclass
-class Location:
-    freq: str | None
-    anti_node: set[str]
-
-    def __repr__(self):
-        if self.freq:
-            return self.freq
-
-        if self.anti_node:
-            return "#"
-
-        else:
-            return "."
-
-
 class Graph:
-    def __init__(self, location_list: List[List[Location]]):
-        self.location_list = location_list
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        # One flag per grid cell: is there an antinode of any frequency here
+        self.anti_nodes = bytearray(len(grid.cells))
         self.freq_locations = self._unique_freqs()
 
     @classmethod
     def from_raw_input(cls, raw_input: str) -> Self:
-        location_list = []
-        for row in raw_input.split("\n"):
-            location_list.append(
-                [Location(x if x != "." else None, set()) for x in list(row)]
-            )
+        return cls(Grid.from_text(raw_input))
 
-        return cls(location_list)
+    def without_antinodes(self) -> Self:
+        """A copy sharing the map and antennas but with no antinodes marked"""
+        graph = copy.copy(self)
+        graph.anti_nodes = bytearray(len(self.grid.cells))
+        return graph
 
     def _unique_freqs(self) -> dict[str, set[tuple[int, int]]]:
         freq_locations = defaultdict(set)
-        for i, row in enumerate(self.location_list):
-            for j, location in enumerate(row):
-                if location.freq:
-                    freq_locations[location.freq].add((i, j))
+        empty = (ord("."), self.grid.fill)
+        for idx, value in enumerate(self.grid.cells):
+            if value not in empty:
+                freq_locations[chr(value)].add(self.grid.coords(idx))
         return freq_locations
 
     def _calculate_antinode_location(
@@ -151,8 +136,11 @@ class Graph:
     ):
         return (node_a[0] - node_b[0]), (node_a[1] - node_b[1])
 
+    def _in_bounds(self, i: int, j: int) -> bool:
+        return 0 <= i < self.grid.height and 0 <= j < self.grid.width
+
     def _populate_antinodes_for_freq(
-        self, freq: str, set_of_locations: set[tuple[int, int]]
+        self, set_of_locations: set[tuple[int, int]]
     ) -> None:
         for curr_node in set_of_locations:
             for other_node in set_of_locations:
@@ -161,17 +149,13 @@ class Graph:
                 anti_node_location_i, anti_node_location_j = (
                     self._calculate_antinode_location(curr_node, other_node)
                 )
-                if 0 <= anti_node_location_i < len(
-                    self.location_list
-                ) and 0 <= anti_node_location_j < len(
-                    self.location_list[anti_node_location_i]
-                ):
-                    self.location_list[anti_node_location_i][
-                        anti_node_location_j
-                    ].anti_node.add(freq)
+                if self._in_bounds(anti_node_location_i, anti_node_location_j):
+                    self.anti_nodes[
+                        self.grid.index(anti_node_location_i, anti_node_location_j)
+                    ] = 1
 
     def _populate_antinodes_for_freq_pt2(
-        self, freq: str, set_of_locations: set[tuple[int, int]]
+        self, set_of_locations: set[tuple[int, int]]
     ) -> None:
         for curr_node in set_of_locations:
             for other_node in set_of_locations:
@@ -183,76 +167,66 @@ class Graph:
                 anti_node_location_i = curr_node[0] + offset_i
                 anti_node_location_j = curr_node[1] + offset_j
 
-                while 0 <= anti_node_location_i < len(
-                    self.location_list
-                ) and 0 <= anti_node_location_j < len(
-                    self.location_list[anti_node_location_i]
-                ):
-                    self.location_list[anti_node_location_i][
-                        anti_node_location_j
-                    ].anti_node.add(freq)
+                while self._in_bounds(anti_node_location_i, anti_node_location_j):
+                    self.anti_nodes[
+                        self.grid.index(anti_node_location_i, anti_node_location_j)
+                    ] = 1
 
                     anti_node_location_i += offset_i
                     anti_node_location_j += offset_j
 
     def populate_antinodes_pt1(self) -> None:
-        for freq, set_of_locations in self.freq_locations.items():
+        for set_of_locations in self.freq_locations.values():
             # add the antinode for each location with every other location
-            self._populate_antinodes_for_freq(freq, set_of_locations)
+            self._populate_antinodes_for_freq(set_of_locations)
 
     def populate_antinodes_pt2(self) -> None:
-        for freq, set_of_locations in self.freq_locations.items():
+        for set_of_locations in self.freq_locations.values():
             # add the antinode for each location with every other location
-            self._populate_antinodes_for_freq_pt2(freq, set_of_locations)
+            self._populate_antinodes_for_freq_pt2(set_of_locations)
 
     def num_unique_antinode_locations(self) -> int:
-        unique_locations = set()
-        for i, row in enumerate(self.location_list):
-            for j, location in enumerate(row):
-                if location.freq:
-                    unique_locations.add((i, j))
-                if len(location.anti_node) > 0:
-                    unique_locations.add((i, j))
+        unique_locations = 0
+        for idx in self.grid.indices():
+            if self.grid[idx] != ord(".") or self.anti_nodes[idx]:
+                unique_locations += 1
 
-        return len(unique_locations)
+        return unique_locations
 
     def __repr__(self):
-        _repr = ""
-        for row in self.location_list:
-            for j in row:
-                _repr += str(j)
-            _repr += "\n"
-        return _repr
-
-
-def part_1(raw_input: str) -> int:
-    my_graph = Graph.from_raw_input(raw_input)
+        rows = []
+        for i in range(self.grid.height):
+            row = ""
+            for j in range(self.grid.width):
+                idx = self.grid.index(i, j)
+                if self.grid[idx] != ord("."):
+                    row += chr(self.grid[idx])
+                elif self.anti_nodes[idx]:
+                    row += "#"
+                else:
+                    row += "."
+            rows.append(row)
+        return "\n".join(rows) + "\n"
+
+
+def parse(raw_input: str) -> Graph:
+    return Graph.from_raw_input(raw_input)
+
+
+def part_1(graph: Graph) -> int:
+    my_graph = graph.without_antinodes()
     my_graph.populate_antinodes_pt1()
     return my_graph.num_unique_antinode_locations()
 
 
-def part_2(raw_input: str) -> int:
-    my_graph = Graph.from_raw_input(raw_input)
+def part_2(graph: Graph) -> int:
+    my_graph = graph.without_antinodes()
     my_graph.populate_antinodes_pt2()
-    print(my_graph)
     return my_graph.num_unique_antinode_locations()
 
 
 def main():
-    raw_input = load_input()
-    # raw_input = example_input
-
-    start_time = time.time()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-    end_time = time.time()
-    print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-    start_time = time.time()
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
-    end_time = time.time()
-    print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(8)
 
 
 if __name__ == "__main__":
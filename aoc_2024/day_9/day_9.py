@@ -46,29 +46,37 @@ Continuing the first example, the first few blocks' position multiplied by its f
 Compact the amphipod's hard drive using the process he requested. What is the resulting filesystem checksum? (Be careful copy/pasting the input for this puzzle; it is a single, very long line.)"""
 
 import dataclasses
-import time
 from typing import Dict, List, Self
 
-from aoc_2024.utils import load_input
+from aoc_2024.runner import run_day
 
 
 example_input = "2333133121414131402"
 
 
+def parse(raw_input: str) -> List[int]:
+    """Sizes from the disk map, alternating file and free space"""
+    return [int(size) for size in raw_input]
+
+
 class FileSystem:
     def __init__(self, disk_map: List[str]):
         self.disk_map = disk_map
 
     @classmethod
     def from_raw_input(cls, raw_input: str) -> Self:
+        return cls.from_sizes(parse(raw_input))
+
+    @classmethod
+    def from_sizes(cls, sizes: List[int]) -> Self:
         disk_map = []
         file_id = 0
-        for odd_or_even, file_size in enumerate(raw_input):
+        for odd_or_even, file_size in enumerate(sizes):
             if odd_or_even % 2 == 0:
-                disk_map.extend([str(file_id)] * int(file_size))
+                disk_map.extend([str(file_id)] * file_size)
                 file_id += 1
             else:
-                disk_map.extend(["."] * int(file_size))
+                disk_map.extend(["."] * file_size)
         return cls(disk_map)
 
     def _find_first_free_space(self, starting_at: int) -> int:
@@ -140,16 +148,20 @@ class FileSystemPt2:
 
     @classmethod
     def from_raw_input(cls, raw_input: str) -> Self:
+        return cls.from_sizes(parse(raw_input))
+
+    @classmethod
+    def from_sizes(cls, sizes: List[int]) -> Self:
         disk_map: DISK_ENTRY_T = []
 
         file_id = 0
-        for odd_or_even, file_size in enumerate(raw_input):
+        for odd_or_even, file_size in enumerate(sizes):
             if odd_or_even % 2 == 0:
-                disk_map.append(_File(id=file_id, size=int(file_size)))
+                disk_map.append(_File(id=file_id, size=file_size))
                 file_id += 1
             else:
-                if int(file_size) > 0:
-                    disk_map.append(_FreeSpace(size=int(file_size)))
+                if file_size > 0:
+                    disk_map.append(_FreeSpace(size=file_size))
         return cls(disk_map)
 
     def _find_largest_file_id(self) -> int:
@@ -235,32 +247,19 @@ class FileSystemPt2:
         return False
 
 
-def part_1(raw_input: str) -> int:
-    my_file_system = FileSystemOptimized.from_raw_input(raw_input)
+def part_1(sizes: List[int]) -> int:
+    my_file_system = FileSystemOptimized.from_sizes(sizes)
     return my_file_system.calculate_checksum()
 
 
-def part_2(raw_input: str) -> int:
-    my_file_system = FileSystemPt2.from_raw_input(raw_input)
+def part_2(sizes: List[int]) -> int:
+    my_file_system = FileSystemPt2.from_sizes(sizes)
     my_file_system.compact_diskmap()
     return my_file_system.calculate_checksum()
 
 
 def main():
-    raw_input = load_input()
-    # raw_input = example_input
-
-    start_time = time.time()
-    part_1_answer = part_1(raw_input)
-    print(f"Part 1 result: {part_1_answer}")
-    end_time = time.time()
-    print(f"Part 1 time: {end_time - start_time:.4f} seconds\n")
-
-    start_time = time.time()
-    part_2_answer = part_2(raw_input)
-    print(f"Part 2 result: {part_2_answer}")
-    end_time = time.time()
-    print(f"Part 2 time: {end_time - start_time:.4f} seconds")
+    run_day(9)
 
 
 if __name__ == "__main__":
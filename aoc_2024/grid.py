@@ -0,0 +1,110 @@
+"""Array-backed character grid shared by the grid-based days.
+
+Cells live row-major in one flat ``bytearray`` surrounded by ``pad`` cells of
+``fill`` on every side, so looking ``pad`` steps past any real cell never goes
+out of range and walking off the map is just reading a fill byte. Cells are
+addressed by flat index; moving in a direction is adding its offset.
+"""
+
+from typing import TYPE_CHECKING, Iterator, List, Self, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_FILL = " "
+
+
+class Grid:
+    def __init__(
+        self,
+        cells: bytearray,
+        width: int,
+        height: int,
+        pad: int = 1,
+        fill: str = DEFAULT_FILL,
+    ) -> None:
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.fill = ord(fill)
+        # Distance between vertically adjacent cells
+        self.stride = width + 2 * pad
+
+        # Clockwise from north, so turning right is (direction + 1) % 4
+        self.offsets_4: Tuple[int, ...] = (-self.stride, 1, self.stride, -1)
+        self.offsets_8: Tuple[int, ...] = self.offsets_4 + (
+            -self.stride + 1,
+            self.stride + 1,
+            self.stride - 1,
+            -self.stride - 1,
+        )
+
+    @classmethod
+    def from_text(cls, text: str, pad: int = 1, fill: str = DEFAULT_FILL) -> Self:
+        rows = text.split("\n")
+        height, width = len(rows), len(rows[0])
+        stride = width + 2 * pad
+
+        fill_byte = fill.encode()
+        cells = bytearray(fill_byte * (stride * pad))
+        for row in rows:
+            cells += fill_byte * pad + row.encode() + fill_byte * pad
+        cells += fill_byte * (stride * pad)
+        return cls(cells, width, height, pad, fill)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def in_bounds(self, index: int) -> bool:
+        row, col = self.coords(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def at(self, row: int, col: int) -> str:
+        return chr(self.cells[self.index(row, col)])
+
+    def indices(self) -> Iterator[int]:
+        """Flat index of every real (non padding) cell, row by row"""
+        for row in range(self.height):
+            start = self.index(row, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, char: str) -> int:
+        """Flat index of the first ``char``, -1 if there is none"""
+        return self.cells.find(ord(char))
+
+    def find_all(self, char: str) -> List[int]:
+        found = []
+        value = ord(char)
+        index = self.cells.find(value)
+        while index != -1:
+            found.append(index)
+            index = self.cells.find(value, index + 1)
+        return found
+
+    def copy(self) -> Self:
+        return type(self)(
+            bytearray(self.cells), self.width, self.height, self.pad, chr(self.fill)
+        )
+
+    def as_array(self) -> "np.ndarray":
+        """2D NumPy ``uint8`` view (padding included) sharing memory with the grid"""
+        import numpy as np
+
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.stride)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[self.index(row, 0) : self.index(row, self.width)].decode()
+            for row in range(self.height)
+        )
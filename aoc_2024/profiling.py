@@ -0,0 +1,115 @@
+"""CPU and memory profiling of a single solver call"""
+
+import cProfile
+import gc
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+# Only re-snapshot memory once it has grown this much past the last snapshot
+SNAPSHOT_GROWTH = 1.1
+# How often the sampling thread checks the traced size, in seconds
+SAMPLE_INTERVAL = 0.01
+
+
+def profile_call(
+    solver: Callable[[Any], Any],
+    puzzle_input: Any,
+    top: int,
+    out_path: Path | None = None,
+) -> Any:
+    """Run ``solver`` under cProfile and print its ``top`` cumulative hotspots.
+
+    ``out_path`` additionally gets the raw stats, readable by snakeviz and friends.
+    """
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(solver, puzzle_input)
+
+    if out_path is not None:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(out_path)
+        print(f"Profile written to {out_path}")
+
+    pstats.Stats(profiler).strip_dirs().sort_stats("cumulative").print_stats(top)
+    return answer
+
+
+def trace_memory(
+    solver: Callable[[Any], Any], puzzle_input: Any, top: int
+) -> Tuple[Any, int, int, List[tracemalloc.Statistic]]:
+    """Run ``solver`` under tracemalloc.
+
+    Returns its answer, the peak traced allocation in bytes, the traced size
+    when the lines were snapshotted and the ``top`` allocating lines at that
+    point. Most of a solver's memory is gone by the time it returns, so a
+    snapshot is taken whenever the traced size has grown enough since the
+    previous one: checked every SAMPLE_INTERVAL from a thread and at every gc.
+    A solver too quick or too small for either only gets one after it returns.
+    """
+    best_snapshot: List[tracemalloc.Snapshot] = []
+    snapshot_size = 0
+    lock = threading.Lock()
+
+    def maybe_snapshot() -> None:
+        nonlocal snapshot_size
+        # Taking a snapshot can itself set off a gc, skip rather than wait
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            current = tracemalloc.get_traced_memory()[0]
+            if current > snapshot_size * SNAPSHOT_GROWTH:
+                best_snapshot[:] = [tracemalloc.take_snapshot()]
+                snapshot_size = current
+        finally:
+            lock.release()
+
+    def on_gc(phase: str, _info: dict) -> None:
+        if phase == "start":
+            maybe_snapshot()
+
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(SAMPLE_INTERVAL):
+            maybe_snapshot()
+
+    tracemalloc.start()
+    gc.callbacks.append(on_gc)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        answer = solver(puzzle_input)
+    finally:
+        done.set()
+        sampler.join()
+        gc.callbacks.remove(on_gc)
+        current, peak = tracemalloc.get_traced_memory()
+        if current > snapshot_size or not best_snapshot:
+            best_snapshot[:] = [tracemalloc.take_snapshot()]
+            snapshot_size = current
+        tracemalloc.stop()
+
+    snapshot = best_snapshot[0].filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    return answer, peak, snapshot_size, snapshot.statistics("lineno")[:top]
+
+
+def print_memory_report(
+    peak: int, snapshot_size: int, statistics: List[tracemalloc.Statistic]
+) -> None:
+    print(f"Peak traced memory: {peak / 2**20:.2f} MiB")
+    # The snapshot can miss the peak, say how close it got
+    missed = " (the peak came and went between samples)"
+    print(
+        f"Top allocating lines at {snapshot_size / 2**20:.2f} MiB traced"
+        f"{missed if snapshot_size * SNAPSHOT_GROWTH < peak else ''}:"
+    )
+    for statistic in statistics:
+        print(f"  {statistic}")
@@ -0,0 +1,105 @@
+"""On-disk cache of answers, keyed on everything that could change them.
+
+An answer is stored under the sha256 of (year, day, part, sha256 of the input,
+sha256 of the day module's source and the shared ``aoc_2024`` modules), one
+small JSON file per answer, so editing the input, the solution or anything it
+builds on like ``grid.py`` naturally misses the cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Tuple
+
+from aoc_2024.utils import ROOT_DIR
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", ROOT_DIR / ".aoc_cache"))
+# Entries are named after their key, a sha256 hex digest
+ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.json")
+# The modules every day can build on (grid, utils, the runner...), all hashed
+# into every day's key rather than working out which ones a day imports
+SHARED_SOURCE_DIR = Path(__file__).parent
+
+
+def hash_bytes(data: bytes | memoryview) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_source(module: ModuleType) -> str:
+    """sha256 of the day module's source and of every shared module"""
+    # Day modules are always plain source files
+    assert module.__file__ is not None, f"{module.__name__} has no source file"
+    digest = hashlib.sha256(Path(module.__file__).read_bytes())
+    for path in sorted(SHARED_SOURCE_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(hash_bytes(path.read_bytes()).encode())
+    return digest.hexdigest()
+
+
+def cache_key(year: int, day: int, part: int, input_hash: str, source_hash: str) -> str:
+    return hash_bytes(f"{year}:{day}:{part}:{input_hash}:{source_hash}".encode())
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.json"
+
+
+def get(key: str) -> Tuple[bool, Any]:
+    """``(True, answer)`` on a hit, ``(False, None)`` on a miss"""
+    path = _entry_path(key)
+    try:
+        entry = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False, None
+    # Bump the mtime so size based eviction drops the least recently used first
+    path.touch()
+    return True, entry["answer"]
+
+
+def put(key: str, answer: Any, **metadata: Any) -> None:
+    try:
+        payload = json.dumps({"answer": answer, "created": time.time(), **metadata})
+    except TypeError:
+        # Not JSON serialisable, just don't cache it
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent readers never see half an entry
+    tmp_path = CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+    tmp_path.write_text(payload)
+    tmp_path.replace(_entry_path(key))
+
+
+def evict(max_age_seconds: float | None = None, max_bytes: int | None = None) -> int:
+    """Delete entries not used for ``max_age_seconds``, then the least recently
+    used ones until the cache fits in ``max_bytes``. Returns how many went."""
+    if not CACHE_DIR.is_dir():
+        return 0
+
+    entries = sorted(
+        (
+            (path.stat(), path)
+            for path in CACHE_DIR.glob("*.json")
+            if ENTRY_NAME.fullmatch(path.name)
+        ),
+        key=lambda entry: entry[0].st_mtime,
+    )
+    now = time.time()
+    removed = 0
+    total_bytes = sum(stat.st_size for stat, _ in entries)
+    for stat, path in entries:
+        too_old = max_age_seconds is not None and now - stat.st_mtime > max_age_seconds
+        too_big = max_bytes is not None and total_bytes > max_bytes
+        if not (too_old or too_big):
+            continue
+        path.unlink(missing_ok=True)
+        total_bytes -= stat.st_size
+        removed += 1
+    return removed
+
+
+def clear() -> int:
+    return evict(max_bytes=0)
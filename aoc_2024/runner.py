@@ -0,0 +1,189 @@
+"""In-process runner for the 2024 days.
+
+Day modules live at ``aoc_2024/day_N/day_N.py`` and expose ``part_1`` and
+``part_2``. A module may also expose ``parse(raw_input)`` to turn the raw puzzle
+text into whatever its parts expect; otherwise the stripped text is passed as is.
+Parsing happens once per day, its result is shared by both parts and timed on
+its own. A module can expose ``teardown()`` too, called once the day is done,
+to release anything its parts kept alive between them.
+"""
+
+import dataclasses
+import importlib
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, List
+
+from aoc_2024 import result_cache, utils
+
+PACKAGE_DIR = Path(__file__).parent
+YEAR = 2024
+PARTS = (1, 2)
+
+
+@dataclasses.dataclass
+class RunOptions:
+    # Number of cProfile hotspots to print, None to not profile
+    profile_top: int | None = None
+    # Directory to write day_N_part_M.prof files to
+    profile_dir: Path | None = None
+    # Number of tracemalloc lines to print, None to not trace memory
+    memory_top: int | None = None
+    # Reuse answers from the on-disk result cache
+    use_cache: bool = True
+
+    @property
+    def profiling(self) -> bool:
+        return self.profile_top is not None or self.memory_top is not None
+
+
+@dataclasses.dataclass
+class PartResult:
+    day: int
+    part: int
+    answer: Any
+    elapsed_ns: int
+    cached: bool = False
+    # Time spent parsing the input, only set on the part that parsed it
+    parse_ns: int = 0
+
+
+def discover_days() -> List[int]:
+    """Days that have a solution module, found without importing any of them"""
+    days = []
+    for day_dir in PACKAGE_DIR.glob("day_*"):
+        day = day_dir.name.removeprefix("day_")
+        if day.isdigit() and (day_dir / f"{day_dir.name}.py").is_file():
+            days.append(int(day))
+    return sorted(days)
+
+
+def input_path(day: int) -> Path:
+    return utils.input_path(year=YEAR, day=day)
+
+
+def load_day(day: int) -> ModuleType:
+    return importlib.import_module(f"aoc_2024.day_{day}.day_{day}")
+
+
+def prepare_input(module: ModuleType, raw_input: str) -> Any:
+    parse = getattr(module, "parse", None)
+    return parse(raw_input) if parse else raw_input
+
+
+def _call_solver(
+    solver: Callable[[Any], Any],
+    puzzle_input: Any,
+    day: int,
+    part: int,
+    options: RunOptions,
+) -> Any:
+    if options.profiling:
+        from aoc_2024 import profiling
+
+    if options.profile_top is not None:
+        out_path = None
+        if options.profile_dir is not None:
+            out_path = options.profile_dir / f"day_{day}_part_{part}.prof"
+        return profiling.profile_call(
+            solver, puzzle_input, options.profile_top, out_path
+        )
+
+    if options.memory_top is not None:
+        answer, peak, snapshot_size, statistics = profiling.trace_memory(
+            solver, puzzle_input, options.memory_top
+        )
+        profiling.print_memory_report(peak, snapshot_size, statistics)
+        return answer
+
+    return solver(puzzle_input)
+
+
+def run_part(
+    module: ModuleType,
+    day: int,
+    part: int,
+    puzzle_input: Any,
+    options: RunOptions = RunOptions(),
+) -> PartResult:
+    solver = getattr(module, f"part_{part}")
+    start_time = time.perf_counter_ns()
+    answer = _call_solver(solver, puzzle_input, day, part, options)
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return PartResult(day, part, answer, elapsed_ns)
+
+
+def run_day(
+    day: int,
+    parts: Iterable[int] = PARTS,
+    options: RunOptions = RunOptions(),
+    report: bool = True,
+) -> List[PartResult]:
+    module = load_day(day)
+    # Profiling always needs a real run
+    use_cache = options.use_cache and not options.profiling
+    if use_cache:
+        input_hash = result_cache.hash_bytes(
+            utils.load_input_buffer(year=YEAR, day=day)
+        )
+        source_hash = result_cache.hash_source(module)
+
+    puzzle_input = None
+    parsed = False
+    results = []
+    try:
+        for part in parts:
+            result = None
+            if use_cache:
+                key = result_cache.cache_key(YEAR, day, part, input_hash, source_hash)
+                result = _cached_result(key, day, part)
+
+            if result is None:
+                parse_ns = 0
+                if not parsed:
+                    raw_input = utils.load_input(year=YEAR, day=day)
+                    start_time = time.perf_counter_ns()
+                    puzzle_input = prepare_input(module, raw_input)
+                    parse_ns = time.perf_counter_ns() - start_time
+                    parsed = True
+                    if report and hasattr(module, "parse"):
+                        print_parse_time(day, parse_ns)
+                result = run_part(module, day, part, puzzle_input, options)
+                result.parse_ns = parse_ns
+                if use_cache:
+                    result_cache.put(key, result.answer, day=day, part=part)
+
+            if report:
+                print_result(result)
+            results.append(result)
+    finally:
+        teardown = getattr(module, "teardown", None)
+        if teardown:
+            teardown()
+    return results
+
+
+def _cached_result(key: str, day: int, part: int) -> PartResult | None:
+    start_time = time.perf_counter_ns()
+    hit, answer = result_cache.get(key)
+    if not hit:
+        return None
+    return PartResult(day, part, answer, time.perf_counter_ns() - start_time, True)
+
+
+def format_ns(elapsed_ns: int) -> str:
+    return f"{elapsed_ns / 1e9:.4f} seconds"
+
+
+def print_parse_time(day: int, parse_ns: int) -> None:
+    print(f"Day {day} parse time: {format_ns(parse_ns)}")
+
+
+def print_result(result: PartResult) -> None:
+    print(f"Day {result.day} part {result.part} result: {result.answer}")
+    cached = " (cached)" if result.cached else ""
+    print(
+        f"Day {result.day} part {result.part} time: "
+        f"{format_ns(result.elapsed_ns)}{cached}"
+    )
@@ -0,0 +1,144 @@
+"""Runs day/part jobs concurrently across a process pool.
+
+Jobs are started longest-expected-first using the wall times of the last run,
+so the slow days don't end up alone at the tail. Every job runs in a fresh
+worker process so its peak RSS is its own, and the days that start their own
+process pool are capped to their share of the machine.
+"""
+
+import dataclasses
+import json
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List
+
+from aoc_2024 import result_cache, runner, utils
+
+# In its own directory so evicting answers leaves it alone
+TIMINGS_PATH = result_cache.CACHE_DIR / "scheduler" / "timings.json"
+
+
+@dataclasses.dataclass
+class JobResult:
+    day: int
+    part: int
+    answer: object
+    wall_ns: int
+    # Included in wall_ns
+    parse_ns: int
+    cpu_ns: int
+    peak_rss_kb: int
+    cached: bool
+
+
+def _cpu_ns(usage: resource.struct_rusage) -> int:
+    return int((usage.ru_utime + usage.ru_stime) * 1e9)
+
+
+def _init_worker(workers_per_job: int) -> None:
+    os.environ[utils.MAX_WORKERS_ENV] = str(workers_per_job)
+
+
+def _run_job(day: int, part: int, options: runner.RunOptions) -> JobResult:
+    start_self = resource.getrusage(resource.RUSAGE_SELF)
+    start_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start_time = time.perf_counter_ns()
+
+    (result,) = runner.run_day(day, [part], options, report=False)
+
+    wall_ns = time.perf_counter_ns() - start_time
+    end_self = resource.getrusage(resource.RUSAGE_SELF)
+    end_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # Include the pools days 6 and 7 start themselves
+    cpu_ns = (
+        _cpu_ns(end_self)
+        - _cpu_ns(start_self)
+        + _cpu_ns(end_children)
+        - _cpu_ns(start_children)
+    )
+    return JobResult(
+        day,
+        part,
+        result.answer,
+        wall_ns,
+        result.parse_ns,
+        cpu_ns,
+        max(end_self.ru_maxrss, end_children.ru_maxrss),
+        result.cached,
+    )
+
+
+def _job_name(day: int, part: int) -> str:
+    return f"{day}.{part}"
+
+
+def load_timings() -> Dict[str, int]:
+    try:
+        return json.loads(TIMINGS_PATH.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(results: Iterable[JobResult]) -> None:
+    timings = load_timings()
+    for result in results:
+        if not result.cached:
+            timings[_job_name(result.day, result.part)] = result.wall_ns
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS_PATH.write_text(json.dumps(timings, indent=2, sort_keys=True) + "\n")
+
+
+def run_all(
+    days: Iterable[int],
+    parts: Iterable[int],
+    jobs: int,
+    options: runner.RunOptions = runner.RunOptions(),
+) -> List[JobResult]:
+    timings = load_timings()
+    # Never seen before sorts first: it could be the slowest of all
+    queue = sorted(
+        ((day, part) for day in days for part in parts),
+        key=lambda job: timings.get(_job_name(*job), float("inf")),
+        reverse=True,
+    )
+    workers_per_job = max(1, (os.cpu_count() or 1) // jobs)
+
+    # A fresh process per job keeps peak RSS per job; forking them from a server
+    # that already imported the runner keeps that cheap
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["aoc_2024.runner"])
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        max_tasks_per_child=1,
+        initializer=_init_worker,
+        initargs=(workers_per_job,),
+    ) as executor:
+        futures = [executor.submit(_run_job, day, part, options) for day, part in queue]
+        results = [future.result() for future in as_completed(futures)]
+
+    results.sort(key=lambda result: (result.day, result.part))
+    save_timings(results)
+    return results
+
+
+def print_report(results: List[JobResult], wall_ns: int) -> None:
+    print(
+        f"{'day':>3} {'part':>4} {'answer':>20} {'wall s':>9} {'parse s':>9} "
+        f"{'cpu s':>9} {'rss MiB':>8}"
+    )
+    for result in results:
+        cached = " cached" if result.cached else ""
+        print(
+            f"{result.day:>3} {result.part:>4} {str(result.answer):>20} "
+            f"{result.wall_ns / 1e9:>9.4f} {result.parse_ns / 1e9:>9.4f} "
+            f"{result.cpu_ns / 1e9:>9.4f} {result.peak_rss_kb / 1024:>8.1f}{cached}"
+        )
+    total_ns = sum(result.wall_ns for result in results)
+    print(
+        f"Total: {wall_ns / 1e9:.4f} seconds elapsed, "
+        f"{total_ns / 1e9:.4f} seconds of job time"
+    )
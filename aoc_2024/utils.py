@@ -1,6 +1,91 @@
-from typing import List
+import mmap
+import os
+import sys
+from functools import cache
+from pathlib import Path
 
+ROOT_DIR = Path(__file__).parent.parent
+INPUT_FILE_NAME = "input.txt"
+# Caps the process pools the days start themselves, set by the job scheduler so
+# concurrent days don't each start a pool the size of the machine
+MAX_WORKERS_ENV = "AOC_MAX_WORKERS"
 
-def load_input() -> str:
-    with open("input.txt") as file:
-        return file.read().strip()
+
+def _caller_dir(depth: int) -> Path:
+    """Directory of the module ``depth`` frames above the caller of this function"""
+    caller_globals = sys._getframe(depth + 1).f_globals
+    caller_file = caller_globals.get("__file__")
+    if caller_file is None:
+        # Interactive sessions have no module file, fall back to the old behaviour
+        return Path.cwd()
+    return Path(caller_file).resolve().parent
+
+
+def input_path(
+    path: str | Path | None = None,
+    *,
+    year: int | None = None,
+    day: int | None = None,
+    _depth: int = 1,
+) -> Path:
+    """Where the puzzle input lives.
+
+    An explicit ``path`` wins, then ``year``/``day`` (year defaults to 2024),
+    otherwise ``input.txt`` next to the module that called us.
+    """
+    if path is not None:
+        return Path(path).resolve()
+    if day is not None:
+        return ROOT_DIR / f"aoc_{year or 2024}" / f"day_{day}" / INPUT_FILE_NAME
+    return _caller_dir(_depth) / INPUT_FILE_NAME
+
+
+@cache
+def _read_text(path: Path, strip: bool) -> str:
+    with open(path) as file:
+        text = file.read()
+    return text.strip() if strip else text
+
+
+@cache
+def _map_file(path: Path) -> memoryview:
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            # Empty files can't be mapped
+            return memoryview(b"")
+        # The map keeps its own handle, so closing the file here is fine
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def load_input(
+    path: str | Path | None = None,
+    *,
+    year: int | None = None,
+    day: int | None = None,
+    strip: bool = True,
+) -> str:
+    """Puzzle input as text, read at most once per process"""
+    return _read_text(input_path(path, year=year, day=day, _depth=2), strip)
+
+
+def load_input_buffer(
+    path: str | Path | None = None,
+    *,
+    year: int | None = None,
+    day: int | None = None,
+) -> memoryview:
+    """Read-only, zero-copy view of the raw input bytes, mapped at most once per process"""
+    return _map_file(input_path(path, year=year, day=day, _depth=2))
+
+
+def clear_input_cache() -> None:
+    _read_text.cache_clear()
+    _map_file.cache_clear()
+
+
+def max_workers() -> int:
+    """How many worker processes a day's own process pool may use"""
+    workers = os.environ.get(MAX_WORKERS_ENV)
+    if workers:
+        return max(1, int(workers))
+    return os.cpu_count() or 1
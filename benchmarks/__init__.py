@@ -0,0 +1 @@
+"""Benchmarks for the 2024 solutions: ``python -m benchmarks --help``"""
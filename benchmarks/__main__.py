@@ -0,0 +1,154 @@
+"""``python -m benchmarks --day 6 --repeat 5 --baseline benchmarks/baseline.json``"""
+
+import argparse
+import dataclasses
+import sys
+from pathlib import Path
+from typing import List
+
+from aoc_2024 import runner
+from aoc_2024.utils import load_input
+from benchmarks import harness, importtime
+from benchmarks.cases import collect_cases
+from benchmarks.generators import generate
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_IMPORT_BUDGET_MS = 150.0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--day", type=int, action="append", help="Can be repeated")
+    parser.add_argument(
+        "--case", default="*", help="Glob on case names, e.g. 'day_9.*'"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        action="append",
+        help="Benchmark on a generated input this many times the real size "
+        "instead of the real input, can be repeated for a sweep",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --scale inputs")
+    parser.add_argument(
+        "--day7-operands",
+        type=int,
+        metavar="N",
+        help="Give every generated day 7 equation N operands instead of 2-12",
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="Also measure peak allocation"
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline with these results instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed median slowdown against the baseline, as a fraction",
+    )
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        help="Fail if importing any benchmarked day module takes longer than "
+        "this, 0 to skip the check",
+    )
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.day7_operands is not None and not args.scale:
+        parser.error("--day7-operands only applies to generated inputs, use --scale")
+    if args.day7_operands is not None and args.day7_operands < 1:
+        parser.error("--day7-operands must be at least 1")
+
+    days = args.day or [
+        day for day in runner.discover_days() if runner.input_path(day).is_file()
+    ]
+
+    results = []
+    for case in collect_cases(days, args.case):
+        module = runner.load_day(case.day)
+        for scale in args.scale or [None]:
+            timed_case = case
+            if scale is None:
+                raw_input = load_input(year=2024, day=case.day)
+            elif case.day == 7 and args.day7_operands is not None:
+                raw_input = generate(
+                    case.day, scale, args.seed, num_operands=args.day7_operands
+                )
+                # Not comparable with a baseline of the usual mix of lengths
+                timed_case = dataclasses.replace(
+                    case, name=f"{case.name}[{args.day7_operands} operands]"
+                )
+            else:
+                raw_input = generate(case.day, scale, args.seed)
+            results.append(
+                harness.time_case(
+                    timed_case,
+                    raw_input if case.raw else runner.prepare_input(module, raw_input),
+                    args.warmup,
+                    args.repeat,
+                    scale=scale,
+                    input_bytes=len(raw_input),
+                    memory=args.memory,
+                )
+            )
+
+    harness.print_table(results)
+
+    slow_imports = []
+    if args.import_budget_ms:
+        import_times = importtime.measure_days(days)
+        print()
+        importtime.print_table(import_times, args.import_budget_ms)
+        slow_imports = importtime.over_budget(import_times, args.import_budget_ms)
+    for slow_import in slow_imports:
+        print(
+            f"SLOW IMPORT {slow_import.module}: {slow_import.cumulative_ms:.1f} ms "
+            f"vs budget {args.import_budget_ms:g} ms",
+            file=sys.stderr,
+        )
+
+    if args.output:
+        harness.write_results(results, args.output)
+
+    if args.save_baseline:
+        harness.write_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 1 if slow_imports else 0
+
+    if not args.baseline.is_file():
+        # Baselines are per machine and not committed; a missing one would
+        # otherwise let every regression through
+        print(
+            f"NO BASELINE at {args.baseline}, run with --save-baseline first",
+            file=sys.stderr,
+        )
+        return 1
+
+    regressions = harness.find_regressions(
+        results, harness.read_results(args.baseline), args.tolerance
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: median {regression.current_ns / 1e6:.3f} ms "
+            f"vs baseline {regression.baseline_ns / 1e6:.3f} ms "
+            f"({regression.slowdown:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions or slow_imports else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Everything the benchmark suite knows how to time.
+
+Every day's ``part_1``/``part_2`` is picked up automatically, and so is its
+``parse`` if it has one; alternative implementations that live next to them
+are listed in ``ALTERNATIVES``.
+"""
+
+import dataclasses
+import fnmatch
+import functools
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+
+from aoc_2024 import runner
+
+
+@dataclasses.dataclass
+class BenchmarkCase:
+    name: str
+    day: int
+    solver: Callable[[Any], Any]
+    # Takes the raw puzzle text rather than the day's parsed model
+    raw: bool = False
+
+
+def _day_9_file_system(module: ModuleType) -> Callable[[List[int]], int]:
+    def solve(sizes: List[int]) -> int:
+        file_system = module.FileSystem.from_sizes(sizes)
+        file_system.compact_disk_map()
+        return file_system.calculate_checksum()
+
+    return solve
+
+
+def _day_9_file_system_optimized(module: ModuleType) -> Callable[[List[int]], int]:
+    def solve(sizes: List[int]) -> int:
+        return module.FileSystemOptimized.from_sizes(sizes).calculate_checksum()
+
+    return solve
+
+
+# day -> {case name: factory taking the day module and returning the solver}.
+# Day 1's part_1 is part_1_naive, so it is already covered.
+ALTERNATIVES: Dict[int, Dict[str, Callable[[ModuleType], Callable[[Any], Any]]]] = {
+    2: {"part_1_updated": lambda module: module.part_1_updated},
+    6: {
+        "part_2_numpy": lambda module: functools.partial(module.part_2, engine="numpy")
+    },
+    7: {
+        "part_1_forward": lambda module: functools.partial(
+            module.part_1, solver="forward"
+        ),
+        "part_2_numpy": lambda module: functools.partial(module.part_2, engine="numpy"),
+    },
+    9: {
+        "part_1_file_system": _day_9_file_system,
+        "part_1_file_system_optimized": _day_9_file_system_optimized,
+    },
+}
+
+
+def cases_for_day(day: int) -> List[BenchmarkCase]:
+    module = runner.load_day(day)
+    cases = []
+    if hasattr(module, "parse"):
+        cases.append(BenchmarkCase(f"day_{day}.parse", day, module.parse, raw=True))
+    cases += [
+        BenchmarkCase(f"day_{day}.part_{part}", day, getattr(module, f"part_{part}"))
+        for part in runner.PARTS
+    ]
+    for name, factory in ALTERNATIVES.get(day, {}).items():
+        cases.append(BenchmarkCase(f"day_{day}.{name}", day, factory(module)))
+    return cases
+
+
+def collect_cases(days: List[int], pattern: str = "*") -> List[BenchmarkCase]:
+    """All cases for the given days whose name matches the glob ``pattern``"""
+    cases: List[BenchmarkCase] = []
+    for day in days:
+        cases.extend(
+            case for case in cases_for_day(day) if fnmatch.fnmatch(case.name, pattern)
+        )
+    return cases
@@ -0,0 +1,190 @@
+"""Seeded generators for scaled-up puzzle inputs.
+
+``scale`` multiplies the amount of data relative to a real puzzle input: more
+lines for the list-like days and more cells (not a longer side) for the grid
+days. The same ``(day, scale, seed)`` always produces the same text.
+"""
+
+import math
+import random
+import string
+from typing import Any, Callable, Dict
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def _grid_side(base_side: int, scale: float) -> int:
+    return max(4, round(base_side * math.sqrt(scale)))
+
+
+def day_1(rng: random.Random, scale: float) -> str:
+    lines = [
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}"
+        for _ in range(round(1000 * scale))
+    ]
+    return "\n".join(lines)
+
+
+def _report(rng: random.Random) -> list[int]:
+    levels = [rng.randint(25, 70)]
+    step_sign = rng.choice((-1, 1))
+    for _ in range(rng.randint(4, 7)):
+        levels.append(levels[-1] + step_sign * rng.randint(1, 3))
+    # Break about half of the reports, some of them beyond repair
+    for _ in range(rng.choice((0, 0, 1, 2))):
+        levels[rng.randrange(len(levels))] += rng.choice((-5, -1, 0, 1, 5))
+    return levels
+
+
+def day_2(rng: random.Random, scale: float) -> str:
+    lines = [
+        " ".join(str(level) for level in _report(rng))
+        for _ in range(round(1000 * scale))
+    ]
+    return "\n".join(lines)
+
+
+def day_3(rng: random.Random, scale: float) -> str:
+    noise = "()[]{}<>!@#$%^&*-+=?/;:,' whatfromselecthowwhowhen"
+    tokens = []
+    for _ in range(round(1500 * scale)):
+        roll = rng.random()
+        if roll < 0.05:
+            tokens.append(rng.choice(("do()", "don't()")))
+        elif roll < 0.5:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif roll < 0.55:
+            # Almost-instructions that must not match
+            tokens.append(f"mul({rng.randint(1, 999)} ,{rng.randint(1, 999)})")
+        else:
+            tokens.append("".join(rng.choices(noise, k=rng.randint(1, 8))))
+    return "".join(tokens)
+
+
+def day_4(rng: random.Random, scale: float) -> str:
+    side = _grid_side(140, scale)
+    return "\n".join("".join(rng.choices("XMAS", k=side)) for _ in range(side))
+
+
+def day_5(rng: random.Random, scale: float) -> str:
+    # A random total order over the pages, with a rule for every pair like the
+    # real input, so that every update has exactly one correct ordering
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{before}|{after}"
+        for i, before in enumerate(pages)
+        for after in pages[i + 1 :]
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(round(200 * scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(str(page) for page in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+def _spiral_patrol(rng: random.Random, board: bytearray, side: int) -> bytearray:
+    """Lay out a patrol that spirals out from the middle of ``board`` and leaves.
+
+    Every leg is at least two cells longer than the leg two turns before it, so
+    the rings never touch and the guard can't loop. Returns the route's cells.
+    """
+    route = bytearray(side * side)
+    row = col = side // 2
+    board[row * side + col] = ord("^")
+    route[row * side + col] = 1
+
+    d_row, d_col = -1, 0
+    legs = [rng.randint(1, 3), rng.randint(1, 3)]
+    while True:
+        length = legs[-2] + rng.randint(2, 5)
+        legs.append(length)
+        end_row, end_col = row + d_row * length, col + d_col * length
+        if not (0 <= end_row + d_row < side and 0 <= end_col + d_col < side):
+            # Walk off the map
+            while 0 <= row < side and 0 <= col < side:
+                route[row * side + col] = 1
+                row, col = row + d_row, col + d_col
+            return route
+
+        for _ in range(length):
+            row, col = row + d_row, col + d_col
+            route[row * side + col] = 1
+        board[(row + d_row) * side + col + d_col] = ord("#")
+        d_row, d_col = d_col, -d_row
+
+
+def day_6(rng: random.Random, scale: float) -> str:
+    # Uniformly random maps trap or release the guard within a few dozen steps,
+    # so lay out a long route first and only scatter obstacles off it
+    side = _grid_side(130, scale)
+    board = bytearray(b"." * (side * side))
+    route = _spiral_patrol(rng, board, side)
+
+    for cell in range(side * side):
+        if not route[cell] and board[cell] == ord(".") and rng.random() < 0.048:
+            board[cell] = ord("#")
+    return "\n".join(
+        board[start : start + side].decode() for start in range(0, side * side, side)
+    )
+
+
+def _apply(operator: str, left: int, right: int) -> int:
+    if operator == "+":
+        return left + right
+    if operator == "*":
+        return left * right
+    return int(f"{left}{right}")
+
+
+def day_7(rng: random.Random, scale: float, num_operands: int | None = None) -> str:
+    lines = []
+    for _ in range(round(850 * scale)):
+        count = num_operands or rng.randint(2, 12)
+        operands = [rng.randint(1, 999)] + [rng.randint(1, 9) for _ in range(count - 1)]
+        total = operands[0]
+        for operand in operands[1:]:
+            total = _apply(rng.choice(("+", "*", "||")), total, operand)
+        if rng.random() < 0.4:
+            # Most of these can't be produced
+            total += rng.randint(1, 1000)
+        lines.append(f"{total}: {' '.join(str(x) for x in operands)}")
+    return "\n".join(lines)
+
+
+def day_8(rng: random.Random, scale: float) -> str:
+    side = _grid_side(50, scale)
+    board = [["."] * side for _ in range(side)]
+    for _ in range(round(180 * scale)):
+        board[rng.randrange(side)][rng.randrange(side)] = rng.choice(FREQUENCIES)
+    return "\n".join("".join(row) for row in board)
+
+
+def day_9(rng: random.Random, scale: float) -> str:
+    # Files are never empty, free space can be; always end on a file
+    length = round(20000 * scale) | 1
+    return "".join(
+        str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+        for i in range(length)
+    )
+
+
+GENERATORS: Dict[int, Callable[..., str]] = {
+    1: day_1,
+    2: day_2,
+    3: day_3,
+    4: day_4,
+    5: day_5,
+    6: day_6,
+    7: day_7,
+    8: day_8,
+    9: day_9,
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0, **options: Any) -> str:
+    """``options`` go to the day's generator, e.g. ``num_operands`` for day 7"""
+    return GENERATORS[day](random.Random(f"{day}:{scale}:{seed}"), scale, **options)
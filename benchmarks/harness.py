@@ -0,0 +1,149 @@
+"""Timing, statistics and baseline comparison for benchmark cases"""
+
+import dataclasses
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.cases import BenchmarkCase
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    repeat: int
+    min_ns: int
+    median_ns: float
+    p95_ns: float
+    stddev_ns: float
+    # Size of the input, None when it was the real puzzle input
+    scale: float | None = None
+    input_bytes: int = 0
+    peak_bytes: int | None = None
+
+    @classmethod
+    def from_timings(
+        cls, name: str, timings: List[int], **extra: Any
+    ) -> "BenchmarkResult":
+        ordered = sorted(timings)
+        return cls(
+            name=name,
+            repeat=len(ordered),
+            min_ns=ordered[0],
+            median_ns=statistics.median(ordered),
+            p95_ns=_percentile(ordered, 95),
+            stddev_ns=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            **extra,
+        )
+
+
+@dataclasses.dataclass
+class Regression:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+def _percentile(ordered: List[int], percent: float) -> float:
+    """Linear interpolation between closest ranks of an already sorted list"""
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def case_name(case: BenchmarkCase, scale: float | None) -> str:
+    return case.name if scale is None else f"{case.name}@{scale:g}x"
+
+
+def measure_peak_bytes(case: BenchmarkCase, puzzle_input: Any) -> int:
+    """Peak Python allocation of one extra run, on top of what is already allocated"""
+    tracemalloc.start()
+    try:
+        case.solver(puzzle_input)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def time_case(
+    case: BenchmarkCase,
+    puzzle_input: Any,
+    warmup: int,
+    repeat: int,
+    scale: float | None = None,
+    input_bytes: int = 0,
+    memory: bool = False,
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        case.solver(puzzle_input)
+
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter_ns()
+        case.solver(puzzle_input)
+        timings.append(time.perf_counter_ns() - start_time)
+
+    return BenchmarkResult.from_timings(
+        case_name(case, scale),
+        timings,
+        scale=scale,
+        input_bytes=input_bytes,
+        peak_bytes=measure_peak_bytes(case, puzzle_input) if memory else None,
+    )
+
+
+def write_results(results: List[BenchmarkResult], path: Path) -> None:
+    payload = {result.name: dataclasses.asdict(result) for result in results}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def read_results(path: Path) -> Dict[str, BenchmarkResult]:
+    payload = json.loads(path.read_text())
+    return {name: BenchmarkResult(**fields) for name, fields in payload.items()}
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    tolerance: float,
+) -> List[Regression]:
+    """Cases whose median got more than ``tolerance`` (a fraction) slower"""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        if result.median_ns > previous.median_ns * (1 + tolerance):
+            regressions.append(
+                Regression(result.name, previous.median_ns, result.median_ns)
+            )
+    return regressions
+
+
+def format_ms(ns: float) -> str:
+    return f"{ns / 1e6:10.3f}"
+
+
+def format_peak(peak_bytes: int | None) -> str:
+    return f"{'-':>10}" if peak_bytes is None else f"{peak_bytes / 2**20:10.2f}"
+
+
+def print_table(results: List[BenchmarkResult]) -> None:
+    print(
+        f"{'case':<42} {'n':>4} {'min ms':>10} {'median ms':>10} "
+        f"{'p95 ms':>10} {'stddev ms':>10} {'peak MiB':>10}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<42} {result.repeat:>4} {format_ms(result.min_ns)} "
+            f"{format_ms(result.median_ns)} {format_ms(result.p95_ns)} "
+            f"{format_ms(result.stddev_ns)} {format_peak(result.peak_bytes)}"
+        )
@@ -0,0 +1,71 @@
+"""Import time of the day modules, measured with ``python -X importtime``.
+
+Each import runs in a fresh interpreter so nothing is already in
+``sys.modules``; the best of a few runs is kept to smooth over a cold disk.
+"""
+
+import dataclasses
+import subprocess
+import sys
+from typing import Iterable, List
+
+DEFAULT_RUNS = 3
+
+
+@dataclasses.dataclass
+class ImportTime:
+    module: str
+    cumulative_us: int
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+
+def day_module(day: int) -> str:
+    return f"aoc_2024.day_{day}.day_{day}"
+
+
+def _parse_cumulative_us(stderr: str, module: str) -> int:
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise ValueError(f"{module} not found in -X importtime output")
+
+
+def measure_import_us(module: str, runs: int = DEFAULT_RUNS) -> int:
+    """Best cumulative import time of ``module`` in microseconds"""
+    return min(_import_once_us(module) for _ in range(max(runs, 1)))
+
+
+def _import_once_us(module: str) -> int:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse_cumulative_us(completed.stderr, module)
+
+
+def measure_days(days: Iterable[int], runs: int = DEFAULT_RUNS) -> List[ImportTime]:
+    return [
+        ImportTime(day_module(day), measure_import_us(day_module(day), runs))
+        for day in days
+    ]
+
+
+def over_budget(times: Iterable[ImportTime], budget_ms: float) -> List[ImportTime]:
+    return [time for time in times if time.cumulative_ms > budget_ms]
+
+
+def print_table(times: List[ImportTime], budget_ms: float) -> None:
+    width = max([len(time.module) for time in times] + [len("module")])
+    print(f"{'module':<{width}} {'import ms':>10}")
+    for time in times:
+        flag = "  over budget" if time.cumulative_ms > budget_ms else ""
+        print(f"{time.module:<{width}} {time.cumulative_ms:>10.1f}{flag}")
@@ -0,0 +1,164 @@
+"""Day 6 against a plain step-by-step walk on small random boards.
+
+Covers the whole part 2 pipeline (jump table, route pruning, resuming from the
+route, the int states, the pool, the NumPy engine and the loop detectors) as
+well as ``iter_patrol`` through part 1 and ``PatrolIndex``.
+"""
+
+import os
+import random
+import unittest
+from typing import List
+from unittest import mock
+
+from aoc_2024 import utils
+from aoc_2024.day_6 import day_6
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def walk(rows: List[List[str]], row: int, col: int) -> tuple[set, bool]:
+    """Cells the guard visits and whether it loops, one step at a time"""
+    height, width = len(rows), len(rows[0])
+    direction = 0
+    seen = set()
+    while (row, col, direction) not in seen:
+        seen.add((row, col, direction))
+        next_row, next_col = (
+            row + DIRECTIONS[direction][0],
+            col + DIRECTIONS[direction][1],
+        )
+        if not (0 <= next_row < height and 0 <= next_col < width):
+            return {(r, c) for r, c, _ in seen}, False
+        if rows[next_row][next_col] == "#":
+            direction = (direction + 1) % 4
+        else:
+            row, col = next_row, next_col
+    return {(r, c) for r, c, _ in seen}, True
+
+
+def loops_with(
+    rows: List[List[str]], start: tuple[int, int], pos: tuple[int, int]
+) -> bool:
+    row, col = pos
+    rows[row][col] = "#"
+    looped = walk(rows, *start)[1]
+    rows[row][col] = "."
+    return looped
+
+
+def random_board(rng: random.Random) -> tuple[List[List[str]], tuple[int, int]]:
+    height, width = rng.randint(1, 12), rng.randint(1, 12)
+    rows = [
+        ["#" if rng.random() < 0.15 else "." for _ in range(width)]
+        for _ in range(height)
+    ]
+    start = rng.randrange(height), rng.randrange(width)
+    rows[start[0]][start[1]] = "."
+    return rows, start
+
+
+def raw_board(rows: List[List[str]], start: tuple[int, int]) -> str:
+    lines = ["".join(row) for row in rows]
+    row, col = start
+    lines[row] = lines[row][:col] + "^" + lines[row][col + 1 :]
+    return "\n".join(lines)
+
+
+def free_cells(rows: List[List[str]], start: tuple[int, int]) -> List[tuple[int, int]]:
+    return [
+        (row, col)
+        for row in range(len(rows))
+        for col in range(len(rows[0]))
+        if rows[row][col] != "#" and (row, col) != start
+    ]
+
+
+def patrol_index(raw_input: str) -> day_6.PatrolIndex:
+    lab = day_6.parse(raw_input)
+    assert lab.start is not None, "every board here has a guard"
+    return day_6.PatrolIndex(lab.board, lab.start)
+
+
+class TestDay6(unittest.TestCase):
+    def test_example(self) -> None:
+        lab = day_6.parse(day_6.example_input)
+        self.assertEqual(day_6.part_1(lab), 41)
+        self.assertEqual(day_6.part_2(lab), 6)
+
+    def test_parts_match_walk(self) -> None:
+        rng = random.Random(1)
+        for _ in range(150):
+            rows, start = random_board(rng)
+            visited, looped = walk(rows, *start)
+            if looped:
+                continue
+            lab = day_6.parse(raw_board(rows, start))
+            want = sum(loops_with(rows, start, pos) for pos in free_cells(rows, start))
+            with self.subTest(board=raw_board(rows, start)):
+                self.assertEqual(day_6.part_1(lab), len(visited))
+                for engine in day_6.ENGINES:
+                    self.assertEqual(day_6.part_2(lab, engine=engine), want)
+                for detector in day_6.DETECTORS:
+                    self.assertEqual(day_6.part_2(lab, detector=detector), want)
+
+    def test_process_pool(self) -> None:
+        rng = random.Random(3)
+        boards = [day_6.example_input]
+        while len(boards) < 6:
+            rows, start = random_board(rng)
+            if not walk(rows, *start)[1]:
+                boards.append(raw_board(rows, start))
+        want = [day_6.part_2(day_6.parse(board)) for board in boards]
+        with mock.patch.dict(os.environ, {utils.MAX_WORKERS_ENV: "2"}):
+            got = [day_6.part_2(day_6.parse(board)) for board in boards]
+        self.assertEqual(got, want)
+
+    def test_patrol_index_add_remove(self) -> None:
+        rng = random.Random(7)
+        for _ in range(60):
+            rows, start = random_board(rng)
+            index = patrol_index(raw_board(rows, start))
+            for _ in range(6):
+                pos = rng.randrange(len(rows)), rng.randrange(len(rows[0]))
+                if pos == start:
+                    continue
+                if rows[pos[0]][pos[1]] == "#":
+                    rows[pos[0]][pos[1]] = "."
+                    index.remove_obstacle(pos)
+                else:
+                    rows[pos[0]][pos[1]] = "#"
+                    index.add_obstacle(pos)
+
+                with self.subTest(board=raw_board(rows, start)):
+                    # The patched table must be what building it afresh gives
+                    self.assertEqual(index.jumps, day_6.build_jumps(index.board))
+                    positions = free_cells(rows, start)
+                    want = [loops_with(rows, start, pos) for pos in positions]
+                    self.assertEqual(
+                        [index.creates_loop(pos) for pos in positions], want
+                    )
+                    for engine in day_6.ENGINES:
+                        self.assertEqual(
+                            index.batch_creates_loop(positions, engine), want
+                        )
+
+    def test_off_board_positions(self) -> None:
+        index = patrol_index(day_6.example_input)
+        for pos in [(0, 10), (0, 12), (-1, 3), (10, 0), (6, -1)]:
+            with self.subTest(pos=pos):
+                with self.assertRaises(ValueError):
+                    index.creates_loop(pos)
+                with self.assertRaises(ValueError):
+                    index.add_obstacle(pos)
+                with self.assertRaises(ValueError):
+                    index.remove_obstacle(pos)
+
+    def test_obstacle_on_guard(self) -> None:
+        index = patrol_index(day_6.example_input)
+        with self.assertRaises(ValueError):
+            index.add_obstacle((6, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Day 7's solvers and engines against trying every combination of operators"""
+
+import itertools
+import os
+import random
+import unittest
+from typing import List
+from unittest import mock
+
+from aoc_2024 import utils
+from aoc_2024.day_7 import day_7
+
+
+def brute_force(total: int, operands: List[int], operators: List[str]) -> bool:
+    for combo in itertools.product(operators, repeat=len(operands) - 1):
+        value = operands[0]
+        for symbol, operand in zip(combo, operands[1:]):
+            if symbol == "+":
+                value += operand
+            elif symbol == "*":
+                value *= operand
+            else:
+                value = int(f"{value}{operand}")
+        if value == total:
+            return True
+    return False
+
+
+def random_equations(rng: random.Random, count: int) -> List[day_7.Equation]:
+    equations = []
+    for _ in range(count):
+        operands = [rng.randint(1, 30) for _ in range(rng.randint(1, 7))]
+        if rng.random() < 0.4:
+            total = rng.randint(1, 10**6)
+        else:
+            combo = [rng.choice(day_7.NEW_OPERATORS) for _ in operands[1:]]
+            total = day_7.evaluate(operands, combo)
+        equations.append(day_7.Equation(total, operands))
+    return equations
+
+
+class TestDay7(unittest.TestCase):
+    def test_example(self) -> None:
+        equations = day_7.parse(day_7.example_input)
+        for solver in day_7.SOLVERS:
+            for engine in day_7.ENGINES:
+                with self.subTest(solver=solver, engine=engine):
+                    self.assertEqual(day_7.part_1(equations, solver, engine), 3749)
+                    self.assertEqual(day_7.part_2(equations, solver, engine), 11387)
+
+    def test_solvers_match_brute_force(self) -> None:
+        rng = random.Random(0)
+        for equation in random_equations(rng, 2000):
+            for operators in day_7.TIERS:
+                want = brute_force(equation.total, equation.operands, operators)
+                for name, solve in day_7.SOLVERS.items():
+                    with self.subTest(
+                        solver=name, equation=equation, operators=operators
+                    ):
+                        self.assertEqual(
+                            solve(equation.total, equation.operands, operators) != 0,
+                            want,
+                        )
+
+    def test_long_equations(self) -> None:
+        # Deeper than the recursion limit if solved one frame per operand
+        for name, solve in day_7.SOLVERS.items():
+            if name == "brute_force":
+                continue
+            for operators in day_7.TIERS:
+                with self.subTest(solver=name, operators=operators):
+                    self.assertEqual(solve(1100, [1] * 1100, operators), 1100)
+                    self.assertEqual(solve(1, [2] * 1100, operators), 0)
+
+    def test_numpy_matches_brute_force(self) -> None:
+        rng = random.Random(1)
+        equations = random_equations(rng, 300)
+        # Past int64, so left to the solver
+        equations.append(day_7.Equation(10**20, [10**9, 10**11]))
+        equations.append(day_7.Equation(10**20 + 5, [10**9, 10**11, 4]))
+        indexes = rng.sample(range(len(equations)), 250) + [300, 301]
+        # Small batches and frontiers, so they get split and fall back too
+        for batch, limit in [(day_7.NUMPY_BATCH, day_7.FRONTIER_LIMIT), (7, 8)]:
+            for operators in day_7.TIERS:
+                want = [
+                    brute_force(equations[i].total, equations[i].operands, operators)
+                    for i in indexes
+                ]
+                with (
+                    self.subTest(batch=batch, limit=limit, operators=operators),
+                    mock.patch.object(day_7, "NUMPY_BATCH", batch),
+                    mock.patch.object(day_7, "FRONTIER_LIMIT", limit),
+                ):
+                    self.assertEqual(
+                        day_7.check_numpy(equations, indexes, operators, "backward"),
+                        want,
+                    )
+
+    def test_pool_sees_edited_equations(self) -> None:
+        equations = day_7.parse(day_7.example_input)
+        with mock.patch.dict(os.environ, {utils.MAX_WORKERS_ENV: "2"}):
+            try:
+                self.assertEqual(day_7.part_1(equations), 3749)
+                equations.append(day_7.Equation(3, [1, 2]))
+                self.assertEqual(day_7.part_1(equations), 3752)
+                equations[0].operands[:] = [10, 18]
+                self.assertEqual(day_7.part_1(equations), 3562)
+            finally:
+                day_7.teardown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Cache keys change with everything an answer depends on"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc_2024 import result_cache
+from aoc_2024.day_1 import day_1
+
+
+class TestHashSource(unittest.TestCase):
+    def setUp(self) -> None:
+        # A copy of the shared modules that can be edited
+        self.shared_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.shared_dir)
+        for path in result_cache.SHARED_SOURCE_DIR.glob("*.py"):
+            shutil.copy(path, self.shared_dir)
+        patcher = mock.patch.object(result_cache, "SHARED_SOURCE_DIR", self.shared_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def key(self) -> str:
+        return result_cache.cache_key(
+            2024, 1, 1, "input", result_cache.hash_source(day_1)
+        )
+
+    def test_unchanged_sources_hit(self) -> None:
+        self.assertEqual(self.key(), self.key())
+
+    def test_editing_a_shared_module_misses(self) -> None:
+        before = self.key()
+        grid = self.shared_dir / "grid.py"
+        grid.write_text(grid.read_text() + "\n# A fix\n")
+        self.assertNotEqual(self.key(), before)
+
+    def test_adding_a_shared_module_misses(self) -> None:
+        before = self.key()
+        (self.shared_dir / "new_helpers.py").write_text("")
+        self.assertNotEqual(self.key(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()